@@ -19,19 +19,24 @@ class DocumentValidator:
         self.supported_extensions = set(config.document.supported_formats)
         self.max_file_size = config.document.max_file_size_mb * 1024 * 1024  # Convert to bytes
     
-    def validate_file_path(self, file_path: str) -> Tuple[bool, Optional[str]]:
+    def validate_file_path(self, file_path: str,
+                           stat_result: Optional[os.stat_result] = None) -> Tuple[bool, Optional[str]]:
         """Validate a file path with detailed error reporting.
         
         Args:
             file_path: The path to the file
+            stat_result: Result of os.stat for the file, if the caller already has it
             
         Returns:
             A tuple of (is_valid, error_message)
         """
         # Check file existence
-        if not os.path.exists(file_path):
-            logger.error(f"File not found: {file_path}")
-            return False, f"File not found: {file_path}"
+        if stat_result is None:
+            try:
+                stat_result = os.stat(file_path)
+            except OSError:
+                logger.error(f"File not found: {file_path}")
+                return False, f"File not found: {file_path}"
         
         # Check file extension
         extension = os.path.splitext(file_path)[1].lower()
@@ -40,7 +45,7 @@ class DocumentValidator:
             return False, f"Unsupported file type: {extension}. Supported types: {', '.join(self.supported_extensions)}"
         
         # Check file size
-        file_size = os.path.getsize(file_path)
+        file_size = stat_result.st_size
         if file_size > self.max_file_size:
             logger.error(f"File too large: {file_path}, size: {file_size} bytes, max: {self.max_file_size} bytes")
             return False, f"File too large. Maximum file size is {config.document.max_file_size_mb}MB."
@@ -1,20 +1,101 @@
+import atexit
+import functools
+import itertools
+import logging
+import math
+import numbers
 import time
 import json
-import uuid
 import os
+import queue
 import threading
-from typing import Dict, Any, List, Optional, Callable
-from datetime import datetime
+from array import array
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Callable, Tuple
+from uuid import uuid4
 from utils.logging_config import get_module_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Create a logger for this module
 logger = get_module_logger("event_manager")
 
+# Bound once so the serialization fallback skips the attribute lookup
+_json_dumps = json.dumps
+
+# Number of locks MetricsCollector stripes pipelines across
+_LOCK_STRIPES = 64
+
+def _event_fields(event: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Get the event type, pipeline ID and step of an event.
+    
+    Args:
+        event: Event data
+        
+    Returns:
+        A tuple of (event_type, pipeline_id, step)
+    """
+    try:
+        # Always present on events published by PipelineContext
+        return event["event_type"], event["pipeline_id"], event["step"]
+    except KeyError:
+        return (
+            event.get("event_type", "unknown"),
+            event.get("pipeline_id", "unknown"),
+            event.get("step", "unknown")
+        )
+
+
+class PipelineEvent(dict):
+    """Event data with memoized JSON serialization.
+    
+    Serialized output is shared by every subscriber that needs it, so
+    events should be treated as read-only once published.
+    """
+    
+    __slots__ = ("_json_line",)
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._json_line = None
+    
+    def json_line(self) -> bytes:
+        """Get the event as a newline-terminated JSON line.
+        
+        Returns:
+            UTF-8 encoded JSON line
+        """
+        if self._json_line is None:
+            if orjson is not None and not self._has_non_finite():
+                try:
+                    self._json_line = orjson.dumps(
+                        self, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+                    )
+                    return self._json_line
+                except TypeError:
+                    # orjson rejects integers wider than 64 bits
+                    pass
+            self._json_line = (_json_dumps(self) + "\n").encode("utf-8")
+        return self._json_line
+    
+    def _has_non_finite(self) -> bool:
+        """Check for NaN or infinite top-level values, which orjson writes as null.
+        
+        Returns:
+            True if a top-level value is a non-finite float
+        """
+        return any(type(value) is float and not math.isfinite(value) for value in self.values())
+
+
 class EventSubscriber:
     """Base class for event subscribers."""
     
     def __init__(self, event_types: List[str] = None):
-        self.event_types = event_types or ["*"]
+        self.event_types = frozenset(event_types or ["*"])
+        self._wildcard = "*" in self.event_types
     
     def handle_event(self, event: Dict[str, Any]) -> None:
         """Handle an event.
@@ -33,75 +114,348 @@ class EventSubscriber:
         Returns:
             True if should handle, False otherwise
         """
-        return "*" in self.event_types or event_type in self.event_types
+        return self._wildcard or event_type in self.event_types
 
 
 class LoggingSubscriber(EventSubscriber):
     """Subscriber that logs events."""
     
+    def __init__(self, event_types: List[str] = None):
+        super().__init__(event_types)
+        self._handlers: Dict[str, Callable[[Dict[str, Any], str, str], None]] = {
+            "step_start": self._on_step_start,
+            "step_end": self._on_step_end,
+            "error": self._on_error,
+            "metric": self._on_metric
+        }
+    
     def handle_event(self, event: Dict[str, Any]) -> None:
         """Log an event.
         
         Args:
             event: Event data
         """
-        event_type = event.get("event_type", "unknown")
-        pipeline_id = event.get("pipeline_id", "unknown")
-        step = event.get("step", "unknown")
-        
-        if event_type == "step_start":
-            logger.info(f"Pipeline {pipeline_id}: Step '{step}' started")
-        elif event_type == "step_end":
-            duration = event.get("duration", 0)
-            logger.info(f"Pipeline {pipeline_id}: Step '{step}' completed in {duration:.2f}s")
-        elif event_type == "error":
-            error = event.get("error", "Unknown error")
-            logger.error(f"Pipeline {pipeline_id}: Error in step '{step}': {error}")
-        elif event_type == "metric":
-            metric_name = event.get("metric_name", "unknown")
-            metric_value = event.get("metric_value", 0)
-            logger.info(f"Pipeline {pipeline_id}: Metric '{metric_name}' = {metric_value} in step '{step}'")
-        else:
-            logger.debug(f"Pipeline {pipeline_id}: Event '{event_type}' in step '{step}'")
+        event_type, pipeline_id, step = _event_fields(event)
+        handler = self._handlers.get(event_type, self._on_other)
+        handler(event, pipeline_id, step)
+    
+    def _on_step_start(self, event: Dict[str, Any], pipeline_id: str, step: str) -> None:
+        """Log a step start event."""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Pipeline %s: Step '%s' started", pipeline_id, step)
+    
+    def _on_step_end(self, event: Dict[str, Any], pipeline_id: str, step: str) -> None:
+        """Log a step end event."""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Pipeline %s: Step '%s' completed in %.2fs",
+                        pipeline_id, step, event.get("duration", 0))
+    
+    def _on_error(self, event: Dict[str, Any], pipeline_id: str, step: str) -> None:
+        """Log an error event."""
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("Pipeline %s: Error in step '%s': %s",
+                         pipeline_id, step, event.get("error", "Unknown error"))
+    
+    def _on_metric(self, event: Dict[str, Any], pipeline_id: str, step: str) -> None:
+        """Log a metric event."""
+        if logger.isEnabledFor(logging.INFO):
+            event_get = event.get
+            logger.info("Pipeline %s: Metric '%s' = %s in step '%s'",
+                        pipeline_id, event_get("metric_name", "unknown"), event_get("metric_value", 0), step)
+    
+    def _on_other(self, event: Dict[str, Any], pipeline_id: str, step: str) -> None:
+        """Log any other event at debug level."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Pipeline %s: Event '%s' in step '%s'",
+                         pipeline_id, event.get("event_type", "unknown"), step)
 
 
 class FileStorageSubscriber(EventSubscriber):
-    """Subscriber that stores events to file."""
+    """Subscriber that stores events to file.
+    
+    Events are queued by ``handle_event`` and written by a background
+    writer thread, which batches whatever is queued (up to
+    ``max_batch_bytes``) into one write per file. At most
+    ``max_open_files`` event files are kept open; the least recently
+    written one is closed to make room.
+    """
+    
+    _STOP = object()
     
     def __init__(self, 
                 output_dir: str = "logs/pipeline_events", 
-                event_types: List[str] = None):
+                event_types: List[str] = None,
+                max_queue_size: int = 10000,
+                max_batch_bytes: int = 1024 * 1024,
+                max_open_files: int = 16):
         super().__init__(event_types)
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
-        self.file_locks = {}
+        self.max_batch_bytes = max_batch_bytes
+        self.max_open_files = max(1, max_open_files)
+        self.fds: "OrderedDict[str, int]" = OrderedDict()
+        self._fds_lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._closed = False
+        self._late_lock = threading.Lock()
+        
+        self._writer = threading.Thread(
+            target=self._writer_loop,
+            name="pipeline-event-writer",
+            daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
     
     def handle_event(self, event: Dict[str, Any]) -> None:
-        """Store an event to file.
+        """Queue an event for storage, or write it directly once closed.
         
         Args:
             event: Event data
         """
-        pipeline_id = event.get("pipeline_id", "unknown")
-        file_path = os.path.join(self.output_dir, f"{pipeline_id}.jsonl")
+        if self._closed:
+            self._write_late(event)
+            return
+        
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            logger.warning(f"Event queue full, dropping '{event.get('event_type', 'unknown')}' event "
+                           f"for pipeline {event.get('pipeline_id', 'unknown')}")
+        
+        # close() may have stopped the writer after the check above
+        if self._closed:
+            self._write_late()
+    
+    def close(self, timeout: float = 5.0) -> None:
+        """Write all queued events and stop the writer thread.
+        
+        Args:
+            timeout: Maximum time to wait for the writer thread
+        """
+        if self._closed:
+            return
+        self._closed = True
+        
+        try:
+            self._queue.put(self._STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning("Event queue still full on close, pending events may be lost")
+        self._writer.join(timeout)
+        
+        # A writer that's still running may be using the descriptors
+        if self._writer.is_alive():
+            logger.warning(f"Event writer didn't stop within {timeout}s, leaving event files open")
+            return
+        
+        # Write anything queued behind the stop marker
+        self._write_late()
+        
+        with self._fds_lock:
+            for fd in self.fds.values():
+                os.close(fd)
+            self.fds.clear()
+    
+    def _write_late(self, event: Optional[Dict[str, Any]] = None) -> None:
+        """Write events synchronously after the writer thread has stopped.
+        
+        Args:
+            event: Event to write, along with anything still queued
+        """
+        if self._writer.is_alive():
+            logger.warning("Event writer still running after close, late events may be lost")
+            return
+        
+        with self._late_lock:
+            events = [] if event is None else [event]
+            while True:
+                try:
+                    events.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            for event in events:
+                if event is self._STOP:
+                    continue
+                try:
+                    if not isinstance(event, PipelineEvent):
+                        event = PipelineEvent(event)
+                    file_path = os.path.join(self.output_dir, f"{event.get('pipeline_id', 'unknown')}.jsonl")
+                    self._write(file_path, event.json_line())
+                except Exception as e:
+                    logger.error(f"Error writing pipeline event after close: {str(e)}")
+    
+    def _writer_loop(self) -> None:
+        """Drain the event queue and write events in batches."""
+        while True:
+            event = self._queue.get()
+            batch: Dict[str, List[bytes]] = {}
+            batch_bytes = 0
+            
+            # Collect everything already queued, up to the batch size
+            while event is not self._STOP:
+                # A bad event is skipped; it must never stop the writer
+                try:
+                    pipeline_id = event.get("pipeline_id", "unknown")
+                    file_path = os.path.join(self.output_dir, f"{pipeline_id}.jsonl")
+                    if not isinstance(event, PipelineEvent):
+                        event = PipelineEvent(event)
+                    line = event.json_line()
+                except Exception as e:
+                    logger.error(f"Skipping pipeline event that can't be serialized: {str(e)}")
+                else:
+                    batch.setdefault(file_path, []).append(line)
+                    batch_bytes += len(line)
+                
+                if batch_bytes >= self.max_batch_bytes:
+                    break
+                try:
+                    event = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            
+            for file_path, lines in batch.items():
+                try:
+                    self._write(file_path, b"".join(lines))
+                except Exception as e:
+                    logger.error(f"Error writing pipeline events to {file_path}: {str(e)}")
+            
+            if event is self._STOP:
+                return
+    
+    def _write(self, file_path: str, data: bytes) -> None:
+        """Append data to an event file.
+        
+        Args:
+            file_path: Path of the event file
+            data: Encoded event lines
+        """
+        with self._fds_lock:
+            fd = self.fds.get(file_path)
+            if fd is None:
+                # Close the least recently written file to stay under the cap
+                while len(self.fds) >= self.max_open_files:
+                    _, evicted = self.fds.popitem(last=False)
+                    os.close(evicted)
+                fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+                self.fds[file_path] = fd
+            else:
+                self.fds.move_to_end(file_path)
+        
+        # os.write may write less than asked for, so loop until done
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+
+
+class MetricSeries:
+    """Samples of a metric or step duration, stored column-wise.
+    
+    Values are kept in a list so ints stay ints; timestamps are packed
+    floats. Only the latest ``max_samples`` samples are kept; once full, the
+    columns are used as a ring buffer. A running total keeps ``mean()``
+    O(1).
+    """
+    
+    __slots__ = ("max_samples", "values", "steps", "timestamps", "total", "_head")
+    
+    def __init__(self, max_samples: int = 1024, track_steps: bool = False):
+        """Initialize an empty series.
+        
+        Args:
+            max_samples: Maximum number of samples to keep
+            track_steps: Whether to record the step of each sample
+            
+        Raises:
+            ValueError: If max_samples is less than 1
+        """
+        if max_samples < 1:
+            raise ValueError(f"max_samples must be at least 1, got {max_samples}")
+        self.max_samples = max_samples
+        self.values: List[float] = []
+        self.steps: Optional[List[str]] = [] if track_steps else None
+        self.timestamps = array("d")
+        self.total = 0.0
+        self._head = 0
+    
+    def __len__(self) -> int:
+        return len(self.values)
+    
+    def append(self, value: float, timestamp: float, step: Optional[str] = None) -> None:
+        """Add a sample, evicting the oldest one if the series is full.
+        
+        Args:
+            value: Sample value
+            timestamp: Sample timestamp
+            step: Step the sample was recorded in
+        """
+        if len(self.values) < self.max_samples:
+            self.values.append(value)
+            self.timestamps.append(timestamp)
+            if self.steps is not None:
+                self.steps.append(step)
+            self.total += value
+            return
+        
+        head = self._head
+        self.total += value - self.values[head]
+        self.values[head] = value
+        self.timestamps[head] = timestamp
+        if self.steps is not None:
+            self.steps[head] = step
         
-        # Get or create lock for this file
-        if file_path not in self.file_locks:
-            self.file_locks[file_path] = threading.Lock()
+        self._head = (head + 1) % self.max_samples
+        if self._head == 0:
+            # Recompute once per wrap so rounding errors don't accumulate
+            self.total = math.fsum(self.values)
+    
+    def mean(self) -> Optional[float]:
+        """Get the mean of the kept samples.
+        
+        Returns:
+            Mean value or None if empty
+        """
+        if not self.values:
+            return None
+        return self.total / len(self.values)
+    
+    def ordered(self, column):
+        """Get a column's samples from oldest to newest.
         
-        # Write event to file
-        with self.file_locks[file_path]:
-            with open(file_path, "a") as f:
-                f.write(json.dumps(event) + "\n")
+        Args:
+            column: One of ``values``, ``steps`` or ``timestamps``
+            
+        Returns:
+            Copy of the column in insertion order
+        """
+        head = self._head
+        return column[head:] + column[:head]
 
 
 class MetricsCollector(EventSubscriber):
     """Subscriber that collects metrics."""
     
-    def __init__(self, event_types: List[str] = None):
+    def __init__(self, event_types: List[str] = None, max_samples: int = 1024):
+        if max_samples < 1:
+            raise ValueError(f"max_samples must be at least 1, got {max_samples}")
         super().__init__(event_types or ["metric", "step_end"])
         self.metrics = {}
-        self.lock = threading.Lock()
+        self.max_samples = max_samples
+        
+        # Locks are striped by pipeline ID so unrelated pipelines don't contend
+        self._stripes = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+    
+    def _lock_for(self, pipeline_id: str) -> threading.Lock:
+        """Get the lock guarding a pipeline's metrics.
+        
+        Args:
+            pipeline_id: Pipeline ID
+            
+        Returns:
+            Lock for the pipeline
+        """
+        return self._stripes[hash(pipeline_id) % _LOCK_STRIPES]
     
     def handle_event(self, event: Dict[str, Any]) -> None:
         """Collect metrics from an event.
@@ -109,38 +463,47 @@ class MetricsCollector(EventSubscriber):
         Args:
             event: Event data
         """
-        event_type = event.get("event_type", "unknown")
-        pipeline_id = event.get("pipeline_id", "unknown")
-        step = event.get("step", "unknown")
+        event_type, pipeline_id, step = _event_fields(event)
+        event_get = event.get
         
-        with self.lock:
-            # Ensure pipeline exists in metrics
-            if pipeline_id not in self.metrics:
-                self.metrics[pipeline_id] = {"steps": {}, "metrics": {}}
-            
+        timestamp = event_get("timestamp")
+        if timestamp is None:
+            timestamp = time.time()
+        
+        if event_type == "metric":
+            value = event_get("metric_value", 0)
+        elif event_type == "step_end":
+            value = event_get("duration", 0)
+        else:
+            return
+        
+        # Check before touching the series so a bad sample can't leave it empty
+        if not isinstance(value, numbers.Real) or not isinstance(timestamp, numbers.Real):
+            logger.warning(f"Ignoring non-numeric {event_type} sample for pipeline {pipeline_id}: "
+                           f"value={value!r}, timestamp={timestamp!r}")
+            return
+        
+        # Ensure pipeline exists in metrics
+        pipeline_metrics = self.metrics.get(pipeline_id)
+        if pipeline_metrics is None:
+            pipeline_metrics = self.metrics.setdefault(pipeline_id, {"steps": {}, "metrics": {}})
+        
+        with self._lock_for(pipeline_id):
             if event_type == "metric":
-                metric_name = event.get("metric_name", "unknown")
-                metric_value = event.get("metric_value", 0)
+                metric_name = event_get("metric_name", "unknown")
                 
                 # Add to metrics
-                if metric_name not in self.metrics[pipeline_id]["metrics"]:
-                    self.metrics[pipeline_id]["metrics"][metric_name] = []
-                
-                self.metrics[pipeline_id]["metrics"][metric_name].append({
-                    "value": metric_value,
-                    "step": step,
-                    "timestamp": event.get("timestamp", time.time())
-                })
+                series = pipeline_metrics["metrics"].get(metric_name)
+                if series is None:
+                    series = pipeline_metrics["metrics"][metric_name] = MetricSeries(self.max_samples, track_steps=True)
+                series.append(value, timestamp, step)
             
             elif event_type == "step_end":
                 # Record step duration
-                if step not in self.metrics[pipeline_id]["steps"]:
-                    self.metrics[pipeline_id]["steps"][step] = []
-                
-                self.metrics[pipeline_id]["steps"][step].append({
-                    "duration": event.get("duration", 0),
-                    "timestamp": event.get("timestamp", time.time())
-                })
+                series = pipeline_metrics["steps"].get(step)
+                if series is None:
+                    series = pipeline_metrics["steps"][step] = MetricSeries(self.max_samples)
+                series.append(value, timestamp)
     
     def get_step_durations(self, pipeline_id: str) -> Dict[str, List[float]]:
         """Get step durations for a pipeline.
@@ -151,13 +514,13 @@ class MetricsCollector(EventSubscriber):
         Returns:
             Dictionary of step names to lists of durations
         """
-        with self.lock:
+        with self._lock_for(pipeline_id):
             if pipeline_id not in self.metrics:
                 return {}
             
             return {
-                step: [run["duration"] for run in runs]
-                for step, runs in self.metrics[pipeline_id]["steps"].items()
+                step: series.ordered(series.values)
+                for step, series in self.metrics[pipeline_id]["steps"].items()
             }
     
     def get_metric_values(self, pipeline_id: str, metric_name: str) -> List[float]:
@@ -170,7 +533,7 @@ class MetricsCollector(EventSubscriber):
         Returns:
             List of metric values
         """
-        with self.lock:
+        with self._lock_for(pipeline_id):
             if pipeline_id not in self.metrics:
                 return []
             
@@ -178,7 +541,8 @@ class MetricsCollector(EventSubscriber):
             if metric_name not in metrics:
                 return []
             
-            return [metric["value"] for metric in metrics[metric_name]]
+            series = metrics[metric_name]
+            return series.ordered(series.values)
     
     def get_average_duration(self, pipeline_id: str, step: str) -> Optional[float]:
         """Get average duration for a step.
@@ -190,11 +554,15 @@ class MetricsCollector(EventSubscriber):
         Returns:
             Average duration or None if no data
         """
-        durations = self.get_step_durations(pipeline_id).get(step, [])
-        if not durations:
-            return None
-        
-        return sum(durations) / len(durations)
+        with self._lock_for(pipeline_id):
+            if pipeline_id not in self.metrics:
+                return None
+            
+            series = self.metrics[pipeline_id]["steps"].get(step)
+            if series is None:
+                return None
+            
+            return series.mean()
     
     def export_metrics(self) -> Dict[str, Any]:
         """Export all metrics.
@@ -202,28 +570,50 @@ class MetricsCollector(EventSubscriber):
         Returns:
             Dictionary of all metrics
         """
-        with self.lock:
-            return json.loads(json.dumps(self.metrics))  # Deep copy
+        exported = {}
+        for pipeline_id, pipeline_metrics in list(self.metrics.items()):
+            with self._lock_for(pipeline_id):
+                steps = {}
+                for step, series in pipeline_metrics["steps"].items():
+                    steps[step] = [
+                        {"duration": duration, "timestamp": timestamp}
+                        for duration, timestamp in zip(series.ordered(series.values),
+                                                       series.ordered(series.timestamps))
+                    ]
+                
+                metrics = {}
+                for name, series in pipeline_metrics["metrics"].items():
+                    metrics[name] = [
+                        {"value": value, "step": step, "timestamp": timestamp}
+                        for value, step, timestamp in zip(series.ordered(series.values),
+                                                          series.ordered(series.steps),
+                                                          series.ordered(series.timestamps))
+                    ]
+            
+            exported[pipeline_id] = {"steps": steps, "metrics": metrics}
+        
+        return exported
 
 
 class PipelineEventManager:
-    """Manages pipeline events for observability."""
+    """Manages pipeline events for observability.
     
-    _instance = None
-    _lock = threading.Lock()
+    There is one shared instance; ``PipelineEventManager()`` returns it, the
+    same as ``get_event_manager()``.
+    """
     
     def __new__(cls):
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super(PipelineEventManager, cls).__new__(cls)
-                cls._instance._initialized = False
-        return cls._instance
+        return get_event_manager()
     
     def __init__(self):
-        if self._initialized:
-            return
-            
+        # The shared instance is set up once, by get_event_manager()
+        pass
+    
+    def _setup(self) -> None:
+        """Create the subscriber index and register the default subscribers."""
         self.subscribers: List[EventSubscriber] = []
+        self._by_type: Dict[str, Tuple[EventSubscriber, ...]] = {}
+        self._wildcard_subscribers: Tuple[EventSubscriber, ...] = ()
         self.metrics_collector = MetricsCollector()
         self.lock = threading.Lock()
         
@@ -232,7 +622,6 @@ class PipelineEventManager:
         self.register_subscriber(FileStorageSubscriber())
         self.register_subscriber(self.metrics_collector)
         
-        self._initialized = True
         logger.debug("Initialized pipeline event manager")
     
     def register_subscriber(self, subscriber: EventSubscriber) -> None:
@@ -243,6 +632,17 @@ class PipelineEventManager:
         """
         with self.lock:
             self.subscribers.append(subscriber)
+            
+            # Index by event type so publishing skips unrelated subscribers.
+            # The index is rebuilt rather than mutated so publish_event can
+            # read it without taking the lock.
+            if subscriber._wildcard:
+                self._wildcard_subscribers = self._wildcard_subscribers + (subscriber,)
+            else:
+                by_type = dict(self._by_type)
+                for event_type in subscriber.event_types:
+                    by_type[event_type] = by_type.get(event_type, ()) + (subscriber,)
+                self._by_type = by_type
     
     def publish_event(self, event: Dict[str, Any]) -> None:
         """Publish an event to all subscribers.
@@ -250,19 +650,28 @@ class PipelineEventManager:
         Args:
             event: Event data
         """
+        event_type = event.get("event_type", "unknown")
+        subscribers = self._by_type.get(event_type, ())
+        wildcard_subscribers = self._wildcard_subscribers
+        
+        # Nothing to do if nobody listens for this event type
+        if not subscribers and not wildcard_subscribers:
+            return
+        
         # Add timestamp if not present
         if "timestamp" not in event:
             event["timestamp"] = time.time()
         
-        event_type = event.get("event_type", "unknown")
+        # Wrap so serialization is shared between subscribers
+        if not isinstance(event, PipelineEvent):
+            event = PipelineEvent(event)
         
         # Dispatch to subscribers
-        for subscriber in self.subscribers:
-            if subscriber.should_handle(event_type):
-                try:
-                    subscriber.handle_event(event)
-                except Exception as e:
-                    logger.error(f"Error in subscriber {subscriber.__class__.__name__}: {str(e)}")
+        for subscriber in itertools.chain(subscribers, wildcard_subscribers):
+            try:
+                subscriber.handle_event(event)
+            except Exception as e:
+                logger.error(f"Error in subscriber {subscriber.__class__.__name__}: {str(e)}")
     
     def get_metrics_collector(self) -> MetricsCollector:
         """Get the metrics collector.
@@ -273,67 +682,143 @@ class PipelineEventManager:
         return self.metrics_collector
 
 
+@functools.lru_cache(maxsize=256)
+def _describe_output(output_type: type,
+                     length: Optional[int],
+                     attributes: Optional[Tuple[str, ...]]) -> Dict[str, Any]:
+    """Describe a step output for step_end events.
+    
+    Results are cached and shared between events, so they must not be modified.
+    
+    Args:
+        output_type: Type of the output
+        length: Length for list and tuple outputs
+        attributes: Attribute names for objects with a ``__dict__``
+        
+    Returns:
+        Output info dictionary
+    """
+    output_info = {"type": output_type.__name__}
+    if length is not None:
+        output_info["length"] = length
+    elif attributes is not None:
+        output_info["attributes"] = list(attributes)
+    return output_info
+
+
+# Generated pipeline IDs are "<pid>-<start time>-<counter>", unique per process
+_PIPELINE_ID_COUNTER = itertools.count()
+_PIPELINE_ID_PREFIX = ""
+
+def _reset_pipeline_id_prefix() -> None:
+    """Set the pipeline ID prefix for the current process."""
+    global _PIPELINE_ID_PREFIX
+    _PIPELINE_ID_PREFIX = f"{os.getpid()}-{int(time.time())}"
+
+_reset_pipeline_id_prefix()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pipeline_id_prefix)
+
+def _next_pipeline_id() -> str:
+    """Generate a pipeline ID without touching the system RNG.
+    
+    Returns:
+        Pipeline ID
+    """
+    return f"{_PIPELINE_ID_PREFIX}-{next(_PIPELINE_ID_COUNTER)}"
+
+
+# Shared event manager, created on first use
+_EVENT_MANAGER: Optional[PipelineEventManager] = None
+_EVENT_MANAGER_LOCK = threading.Lock()
+
+def get_event_manager() -> PipelineEventManager:
+    """Get the shared pipeline event manager.
+    
+    Returns:
+        Pipeline event manager
+    """
+    global _EVENT_MANAGER
+    
+    # Only lock while the instance is being created
+    event_manager = _EVENT_MANAGER
+    if event_manager is not None:
+        return event_manager
+    
+    with _EVENT_MANAGER_LOCK:
+        if _EVENT_MANAGER is None:
+            event_manager = object.__new__(PipelineEventManager)
+            event_manager._setup()
+            _EVENT_MANAGER = event_manager
+        return _EVENT_MANAGER
+
+
 class PipelineContext:
     """Context for a pipeline run."""
     
-    def __init__(self, pipeline_id: str = None, parent_id: str = None):
-        self.pipeline_id = pipeline_id or str(uuid.uuid4())
+    def __init__(self, pipeline_id: str = None, parent_id: str = None, use_uuid: bool = False):
+        if not pipeline_id:
+            pipeline_id = str(uuid4()) if use_uuid else _next_pipeline_id()
+        self.pipeline_id = pipeline_id
         self.parent_id = parent_id
-        self.event_manager = PipelineEventManager()
+        self.event_manager = get_event_manager()
         self.start_time = time.time()
+        self._start_ns = time.perf_counter_ns()
         self.step_times = {}
     
-    def record_step_start(self, step: str) -> None:
+    def record_step_start(self, step: str) -> int:
         """Record the start of a pipeline step.
         
         Args:
             step: Step name
+            
+        Returns:
+            Start token (``perf_counter_ns``) to pass to ``record_step_end``
         """
-        self.step_times[step] = time.time()
+        start_ns = time.perf_counter_ns()
+        self.step_times[step] = start_ns
         
-        self.event_manager.publish_event({
+        self.event_manager.publish_event(PipelineEvent({
             "event_type": "step_start",
             "pipeline_id": self.pipeline_id,
             "parent_id": self.parent_id,
             "step": step
-        })
+        }))
+        
+        return start_ns
     
-    def record_step_end(self, step: str, outputs: Any = None) -> None:
+    def record_step_end(self, step: str, outputs: Any = None, start_ns: Optional[int] = None) -> None:
         """Record the end of a pipeline step.
         
         Args:
             step: Step name
             outputs: Step outputs
+            start_ns: Start token from ``record_step_start``, avoids the step lookup
         """
-        start_time = self.step_times.get(step, self.start_time)
-        duration = time.time() - start_time
+        end_ns = time.perf_counter_ns()
+        if start_ns is None:
+            start_ns = self.step_times.get(step, self._start_ns)
+        duration = (end_ns - start_ns) * 1e-9
         
         output_info = None
         if outputs is not None:
             # Try to get some general info about the output
+            output_type = type(outputs)
             if isinstance(outputs, (list, tuple)):
-                output_info = {
-                    "type": type(outputs).__name__,
-                    "length": len(outputs)
-                }
+                output_info = _describe_output(output_type, len(outputs), None)
             elif hasattr(outputs, "__dict__"):
-                output_info = {
-                    "type": type(outputs).__name__,
-                    "attributes": list(outputs.__dict__.keys())
-                }
+                output_info = _describe_output(output_type, None, tuple(outputs.__dict__))
             else:
-                output_info = {
-                    "type": type(outputs).__name__
-                }
+                output_info = _describe_output(output_type, None, None)
         
-        self.event_manager.publish_event({
+        self.event_manager.publish_event(PipelineEvent({
             "event_type": "step_end",
             "pipeline_id": self.pipeline_id,
             "parent_id": self.parent_id,
             "step": step,
             "duration": duration,
             "output_info": output_info
-        })
+        }))
     
     def record_error(self, step: str, error: Exception) -> None:
         """Record an error in a pipeline step.
@@ -342,14 +827,14 @@ class PipelineContext:
             step: Step name
             error: Exception that occurred
         """
-        self.event_manager.publish_event({
+        self.event_manager.publish_event(PipelineEvent({
             "event_type": "error",
             "pipeline_id": self.pipeline_id,
             "parent_id": self.parent_id,
             "step": step,
             "error": str(error),
             "error_type": type(error).__name__
-        })
+        }))
     
     def record_metric(self, step: str, metric_name: str, value: float) -> None:
         """Record a metric for a pipeline step.
@@ -359,14 +844,14 @@ class PipelineContext:
             metric_name: Metric name
             value: Metric value
         """
-        self.event_manager.publish_event({
+        self.event_manager.publish_event(PipelineEvent({
             "event_type": "metric",
             "pipeline_id": self.pipeline_id,
             "parent_id": self.parent_id,
             "step": step,
             "metric_name": metric_name,
             "metric_value": value
-        })
+        }))
     
     def get_step_timing(self, step: str) -> Optional[float]:
         """Get the duration of a step.
@@ -378,7 +863,7 @@ class PipelineContext:
             Step duration or None if step not completed
         """
         if step in self.step_times:
-            return time.time() - self.step_times[step]
+            return (time.perf_counter_ns() - self.step_times[step]) * 1e-9
         return None
 
 
@@ -411,14 +896,14 @@ class step_timing:
                 context = PipelineContext()
             
             # Record step start
-            context.record_step_start(self.step_name)
+            start_ns = context.record_step_start(self.step_name)
             
             try:
                 # Call the function
                 result = func(*args, **kwargs)
                 
                 # Record step end
-                context.record_step_end(self.step_name, result)
+                context.record_step_end(self.step_name, result, start_ns)
                 
                 return result
             except Exception as e:
@@ -1,26 +1,394 @@
 # core/document_processing/document_loader.py
 
 import os
+import sys
 import json
+import math
 import csv
+import itertools
 import io
-import pandas as pd
-from typing import List, Optional, Dict, Any, Tuple
+import codecs
+import mmap
+import multiprocessing
+import re
+import gzip
+import hashlib
+import importlib
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import List, Optional, Dict, Any, Tuple, Iterator
 from langchain.schema import Document
 from config.logging_config import get_module_logger
 from core.document_processing.document_validator import DocumentValidator
 
-# Import specialized document loaders
-from pdfminer.high_level import extract_text
-from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
-from pdfminer.converter import TextConverter
-from pdfminer.layout import LAParams
-from pdfminer.pdfpage import PDFPage
-from docx import Document as DocxDocument
+# pandas, pdfminer, docx and the optional accelerators are imported on first
+# use, so loading light formats doesn't pay their import time and memory
 
 # Create a logger for this module
 logger = get_module_logger("document_loader")
 
+# A run of digits long enough to overflow 64 bits; orjson reads such
+# integers as floats, losing precision
+_WIDE_INT_RE = re.compile(rb'\d{19,}')
+
+# python-docx's Document class, imported by the first DOCX load
+DocxDocument = None
+
+# Optional modules by name, None for those that aren't installed
+_OPTIONAL_MODULES: Dict[str, Any] = {}
+
+# Bytes read to tell a top-level JSON array from an object
+_JSON_PEEK_BYTES = 1024
+
+# Document type reported in metadata for each extension
+_EXT_TO_DOCTYPE = {
+    '.pdf': "pdf",
+    '.docx': "document",
+    '.doc': "document",
+    '.txt': "text",
+    '.md': "text",
+    '.csv': "spreadsheet",
+    '.xlsx': "spreadsheet",
+    '.xls': "spreadsheet",
+    '.json': "data",
+}
+
+# Interned extension strings, so dict lookups on them can hit by identity
+_EXT_INTERN = {ext: sys.intern(ext) for ext in _EXT_TO_DOCTYPE}
+
+# Bytes read from a CSV or large text file to detect its encoding
+_ENCODING_SAMPLE_BYTES = 64 * 1024
+
+# Data shorter than this is too little for charset_normalizer to judge
+_MIN_DETECTION_BYTES = 512
+
+# Text files above this size have their encoding detected from a sample
+_TEXT_SAMPLE_THRESHOLD = 10 * 1024 * 1024
+
+# Byte order marks; UTF-32 LE must be checked before UTF-16 LE
+_BOMS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# Extracted text of these formats is cached on disk between loads, when a
+# cache directory is configured
+_CACHED_EXTENSIONS = frozenset({'.pdf'})
+_CACHE_SUFFIX = ".txt.gz"
+
+# Limits on spreadsheet preview rows, so very wide files stay readable
+_MAX_PREVIEW_COLS = 40
+_MAX_CELL_CHARS = 200
+
+# Summary statistics reported per numeric column, as in pandas' describe()
+_STAT_FIELDS = ('count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max')
+
+# Extensions whose parsing is CPU-bound enough to load in a separate process
+_PROCESS_POOL_EXTENSIONS = frozenset({'.pdf', '.xlsx', '.xls', '.csv'})
+
+# Layout parameters for pdfminer, built on first use
+_LAPARAMS = None
+
+
+def _get_laparams():
+    """Get the shared pdfminer layout parameters.
+    
+    Returns:
+        LAParams instance
+    """
+    global _LAPARAMS
+    if _LAPARAMS is None:
+        from pdfminer.layout import LAParams
+        
+        _LAPARAMS = LAParams(
+            line_margin=0.5,
+            word_margin=0.1,
+            char_margin=2.0,
+            all_texts=True
+        )
+    return _LAPARAMS
+
+
+def _optional_import(name: str) -> Any:
+    """Import an optional dependency on first use.
+    
+    Args:
+        name: Module name
+        
+    Returns:
+        The module, or None if it isn't installed
+    """
+    try:
+        return _OPTIONAL_MODULES[name]
+    except KeyError:
+        pass
+    try:
+        module = importlib.import_module(name)
+    except ImportError:
+        module = None
+    _OPTIONAL_MODULES[name] = module
+    return module
+
+
+def _get_pyarrow() -> Optional[Tuple[Any, Any, Any]]:
+    """Get pyarrow with its compute and CSV modules.
+    
+    Returns:
+        Tuple of (pyarrow, pyarrow.compute, pyarrow.csv), or None if
+        pyarrow isn't installed
+    """
+    pa_csv = _optional_import('pyarrow.csv')
+    if pa_csv is None:
+        return None
+    return _optional_import('pyarrow'), _optional_import('pyarrow.compute'), pa_csv
+
+
+def _json_errors() -> Tuple[type, ...]:
+    """Get the exceptions raised for malformed JSON.
+    
+    Returns:
+        Exception types; orjson's error subclasses json's
+    """
+    ijson = _optional_import('ijson')
+    if ijson is None:
+        return (json.JSONDecodeError,)
+    return (json.JSONDecodeError, ijson.JSONError)
+
+
+def _file_extension(file_path: str) -> str:
+    """Get the lower-cased extension of a file path.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        Extension including the dot, interned if it's a known one
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    return _EXT_INTERN.get(extension, extension)
+
+
+def _looks_garbled(text: str, sample_size: int = 2000) -> bool:
+    """Check whether extracted text is mostly unprintable characters.
+    
+    Args:
+        text: Extracted text
+        sample_size: Number of characters to inspect
+        
+    Returns:
+        True if the text looks like a failed extraction
+    """
+    sample = text[:sample_size]
+    if not sample:
+        return False
+    printable = sum(1 for ch in sample if ch.isprintable() or ch.isspace())
+    return printable / len(sample) < 0.9
+
+
+def _sniff_bom(head: bytes) -> Optional[str]:
+    """Get the encoding announced by a byte order mark.
+    
+    Args:
+        head: First bytes of the file
+        
+    Returns:
+        Encoding name or None if there is no BOM
+    """
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+    return None
+
+
+def _trim_partial_utf8(data: bytes) -> bytes:
+    """Drop a UTF-8 sequence cut off at the end of a sample.
+    
+    Args:
+        data: Leading bytes of a file
+        
+    Returns:
+        Data without a trailing incomplete multi-byte sequence
+    """
+    # Walk back over continuation bytes to the lead byte of the last sequence
+    for back in range(1, min(4, len(data)) + 1):
+        byte = data[-back]
+        if byte & 0xC0 == 0x80:
+            continue
+        if byte >= 0xC0:
+            length = 2 if byte < 0xE0 else 3 if byte < 0xF0 else 4
+            if length > back:
+                return data[:-back]
+        break
+    return data
+
+
+def _detect_encoding(data: bytes) -> Optional[str]:
+    """Detect the text encoding of raw bytes.
+    
+    Args:
+        data: Raw file content or a sample of it
+        
+    Returns:
+        Encoding name or None if the data can't be decoded
+    """
+    encoding = _sniff_bom(data)
+    if encoding is not None:
+        return encoding
+    
+    # Valid UTF-8 is almost never text in another encoding, and ASCII data
+    # is reported as UTF-8 so non-ASCII bytes past a sample still decode
+    try:
+        data.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+    
+    # The detector guesses wildly on a few bytes, so short data goes
+    # straight to the common single-byte encodings
+    charset_normalizer = _optional_import('charset_normalizer')
+    if charset_normalizer is not None and len(data) >= _MIN_DETECTION_BYTES:
+        best = charset_normalizer.from_bytes(data).best()
+        if best is not None:
+            encoding = codecs.lookup(best.encoding).name
+            # UTF-16/32 without a BOM is almost always a misdetection
+            if not encoding.startswith(('utf-16', 'utf-32')):
+                return 'utf-8' if encoding == 'ascii' else encoding
+    
+    # Otherwise try common encodings in order
+    for encoding in ('cp1252', 'latin-1'):
+        try:
+            data.decode(encoding)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return None
+
+
+def _cell_text(value: Any) -> str:
+    """Format a spreadsheet cell for display.
+    
+    Args:
+        value: Cell value
+        
+    Returns:
+        Cell text, empty for blank cells
+    """
+    return "" if value is None else str(value)
+
+
+def _format_row(values: List[Any], column_count: Optional[int] = None) -> str:
+    """Format a spreadsheet row for a preview, capping its width.
+    
+    Args:
+        values: Cell values, possibly already cut to _MAX_PREVIEW_COLS
+        column_count: Number of columns in the full row, defaults to len(values)
+        
+    Returns:
+        Row text with cells separated by " | "
+    """
+    if column_count is None:
+        column_count = len(values)
+    text = " | ".join(
+        _cell_text(value)[:_MAX_CELL_CHARS] for value in itertools.islice(values, _MAX_PREVIEW_COLS)
+    )
+    if column_count > _MAX_PREVIEW_COLS:
+        text += f" ... (+{column_count - _MAX_PREVIEW_COLS} more cols)"
+    return text
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON, with orjson when available.
+    
+    Documents that may hold integers wider than 64 bits go through the
+    json module, which keeps them exact.
+    
+    Args:
+        data: UTF-8 encoded JSON
+        
+    Returns:
+        Parsed data
+    """
+    orjson = _optional_import('orjson')
+    if orjson is not None and not _WIDE_INT_RE.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN and Infinity, which the json module accepts
+            pass
+    return json.loads(data)
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Check parsed JSON for NaN or infinite numbers.
+    
+    Args:
+        data: Parsed data
+        
+    Returns:
+        True if any number in it is NaN or infinite
+    """
+    if type(data) is float:
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite(value) for value in data.values())
+    if isinstance(data, list):
+        return any(_has_non_finite(value) for value in data)
+    return False
+
+
+def _json_pretty(data: Any) -> str:
+    """Format data as indented JSON, with orjson when available.
+    
+    Args:
+        data: Data to format
+        
+    Returns:
+        JSON text with two-space indentation
+    """
+    orjson = _optional_import('orjson')
+    # orjson writes NaN and Infinity as null
+    if orjson is not None and not _has_non_finite(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+        except TypeError:
+            # orjson rejects integers wider than 64 bits
+            pass
+    return json.dumps(data, indent=2)
+
+
+def _format_stat(value: Optional[float]) -> str:
+    """Format a summary statistic for display.
+    
+    Args:
+        value: Statistic value
+        
+    Returns:
+        Formatted value
+    """
+    # NaN compares unequal to itself
+    if value is None or value != value:
+        return "n/a"
+    return f"{value:.6g}"
+
+
+def _format_column_stats(name: str, stats: Dict[str, Optional[float]]) -> str:
+    """Format the summary statistics of one numeric column.
+    
+    Args:
+        name: Column name
+        stats: Statistic values keyed by _STAT_FIELDS names
+        
+    Returns:
+        One line with the same fields as pandas' describe()
+    """
+    fields = [f"count={int(stats['count'])}"]
+    fields.extend(f"{field}={_format_stat(stats[field])}" for field in _STAT_FIELDS[1:])
+    return f"{name}: " + ", ".join(fields)
+
+
 class LoaderResult:
     """Stores the result of a document loading operation."""
     
@@ -53,15 +421,20 @@ class PDFLoader:
             A tuple of (extracted_text, error_message)
         """
         try:
-            # First try with pdfminer's high-level interface
-            text = extract_text(file_path)
+            # First try with pdfium, which is much faster than pdfminer
+            text = None
+            pdfium = _optional_import('pypdfium2')
+            if pdfium is not None:
+                try:
+                    text = self._extract_with_pdfium(pdfium, file_path)
+                except Exception as e:
+                    logger.warning(f"pdfium could not read {file_path}, falling back to pdfminer: {str(e)}")
             
-            # Check if we extracted any text
-            if text and text.strip():
-                return text.strip(), None
-                
-            # If not, try with more detailed control over extraction parameters
-            text = self._extract_with_custom_params(file_path)
+            # Fall back to pdfminer, which copes better with unusual font
+            # encodings. A PDF pdfium read without finding any text is
+            # scanned or image-only, and parsing it again won't help.
+            if text is None or _looks_garbled(text):
+                text = self._extract_with_custom_params(file_path)
             
             if not text.strip():
                 return None, "Could not extract text from PDF. The file may be scanned or contain only images."
@@ -72,6 +445,28 @@ class PDFLoader:
             logger.error(f"Error loading PDF {file_path}: {str(e)}")
             return None, f"Error loading PDF: {str(e)}"
     
+    def _extract_with_pdfium(self, pdfium: Any, file_path: str) -> str:
+        """Extract text from PDF with pypdfium2.
+        
+        Args:
+            pdfium: The pypdfium2 module
+            file_path: Path to the PDF file
+            
+        Returns:
+            Extracted text
+        """
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            pages = []
+            for page in pdf:
+                textpage = page.get_textpage()
+                pages.append(textpage.get_text_range())
+                textpage.close()
+                page.close()
+            return "\n".join(pages)
+        finally:
+            pdf.close()
+    
     def _extract_with_custom_params(self, file_path: str) -> str:
         """Extract text from PDF with custom parameters for better results.
         
@@ -81,25 +476,30 @@ class PDFLoader:
         Returns:
             Extracted text
         """
+        from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+        from pdfminer.converter import TextConverter
+        from pdfminer.pdfpage import PDFPage
+        
+        # The resource manager caches fonts by object id, which is only
+        # unique within one document, so it can't be shared
         resource_manager = PDFResourceManager()
         output_string = io.StringIO()
         codec = 'utf-8'
-        laparams = LAParams(
-            line_margin=0.5,
-            word_margin=0.1,
-            char_margin=2.0,
-            all_texts=True
-        )
+        laparams = _get_laparams()
         
+        # Collect one chunk per page and reuse the buffer, so the whole
+        # document is never held twice while copying it out
+        parts = []
         with open(file_path, 'rb') as file:
             with TextConverter(resource_manager, output_string, codec=codec, laparams=laparams) as converter:
                 interpreter = PDFPageInterpreter(resource_manager, converter)
                 for page in PDFPage.get_pages(file, check_extractable=False):
                     interpreter.process_page(page)
-                
-                text = output_string.getvalue()
+                    parts.append(output_string.getvalue())
+                    output_string.seek(0)
+                    output_string.truncate()
         
-        return text
+        return "".join(parts)
 
 
 class DocxLoader:
@@ -115,26 +515,32 @@ class DocxLoader:
             A tuple of (extracted_text, error_message)
         """
         try:
+            global DocxDocument
+            if DocxDocument is None:
+                from docx import Document as DocxDocument
+            
             doc = DocxDocument(file_path)
             
             # Extract paragraphs with formatting preservation
-            text = ""
+            parts = []
             for para in doc.paragraphs:
                 if para.text:
-                    text += para.text + "\n"
+                    parts.append(para.text + "\n")
                     
                     # Check for hyperlinks and other elements
                     for run in para.runs:
                         if run.hyperlink:
-                            text += f" [Link: {run.hyperlink.url}]"
+                            parts.append(f" [Link: {run.hyperlink.url}]")
             
             # Extract tables
             for table in doc.tables:
-                text += "\nTable Content:\n"
+                parts.append("\nTable Content:\n")
                 for row in table.rows:
                     row_text = " | ".join([cell.text for cell in row.cells if cell.text])
                     if row_text:
-                        text += row_text + "\n"
+                        parts.append(row_text + "\n")
+            
+            text = "".join(parts)
             
             # Check if we extracted any text
             if not text.strip():
@@ -160,30 +566,87 @@ class TextLoader:
             A tuple of (file_content, error_message)
         """
         try:
-            # Try multiple encodings
-            encodings = ['utf-8', 'latin-1', 'ascii', 'cp1252']
+            with open(file_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    return None, "Text file contains no text."
+                
+                # Map the file and decode straight from the mapping
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Most text is plain ASCII; CPython's ASCII decoder
+                    # checks a machine word at a time and stops at the
+                    # first non-ASCII byte, so try it before any detection
+                    try:
+                        content = str(mm, 'ascii')
+                    except UnicodeDecodeError:
+                        content = self._decode(mm, size)
+                        if content is None:
+                            return None, "Could not decode text file with supported encodings."
             
-            for encoding in encodings:
-                try:
-                    with open(file_path, 'r', encoding=encoding) as f:
-                        content = f.read()
-                    
-                    if content.strip():
-                        return content, None
-                except UnicodeDecodeError:
-                    continue
+            if not content.strip():
+                return None, "Text file contains no text."
             
-            # If we get here, none of the encodings worked
-            return None, "Could not decode text file with supported encodings."
+            return content, None
                 
         except Exception as e:
             logger.error(f"Error loading text file {file_path}: {str(e)}")
             return None, f"Error loading text file: {str(e)}"
+    
+    def _decode(self, mm: mmap.mmap, size: int) -> Optional[str]:
+        """Decode non-ASCII file content, detecting its encoding.
+        
+        Every decode is strict, so a wrong guess fails instead of
+        producing mojibake.
+        
+        Args:
+            mm: Mapping of the whole file
+            size: File size in bytes
+            
+        Returns:
+            Decoded text or None if no encoding fits
+        """
+        encoding = _sniff_bom(mm[:4])
+        if encoding is not None:
+            return str(mm, encoding)
+        
+        # UTF-8 is the most common non-ASCII encoding, and a strict decode
+        # can't accept text in another one by mistake
+        try:
+            return str(mm, 'utf-8')
+        except UnicodeDecodeError:
+            pass
+        
+        # Large files are detected from a sample first; the sample can't
+        # prove the rest decodes, so a failed guess falls back to the whole file
+        if size > _TEXT_SAMPLE_THRESHOLD:
+            encoding = _detect_encoding(_trim_partial_utf8(mm[:_ENCODING_SAMPLE_BYTES]))
+            if encoding is not None:
+                try:
+                    return str(mm, encoding)
+                except UnicodeDecodeError:
+                    logger.debug(f"Sampled encoding {encoding} doesn't fit the whole file, detecting again")
+        
+        encoding = _detect_encoding(mm[:])
+        if encoding is None:
+            return None
+        try:
+            return str(mm, encoding)
+        except UnicodeDecodeError:
+            return None
 
 
 class CSVLoader:
     """Handles loading and processing CSV files."""
     
+    def __init__(self, include_statistics: bool = True):
+        """Initialize loader.
+        
+        Args:
+            include_statistics: Whether to add summary statistics for numeric columns,
+                which needs a full parse of the file
+        """
+        self.include_statistics = include_statistics
+    
     def load(self, file_path: str) -> Tuple[Optional[str], Optional[str]]:
         """Load and parse CSV file.
         
@@ -194,61 +657,152 @@ class CSVLoader:
             A tuple of (parsed_content, error_message)
         """
         try:
-            # Try to detect dialect and encoding
+            # Detect encoding from a sample of the file
             with open(file_path, 'rb') as f:
-                sample = f.read(4096)
-            
-            # Try to detect encoding
-            encodings = ['utf-8', 'latin-1', 'ascii', 'cp1252']
-            detected_encoding = None
-            
-            for encoding in encodings:
-                try:
-                    sample.decode(encoding)
-                    detected_encoding = encoding
-                    break
-                except UnicodeDecodeError:
-                    continue
+                sample = f.read(_ENCODING_SAMPLE_BYTES)
             
+            detected_encoding = _detect_encoding(_trim_partial_utf8(sample))
             if not detected_encoding:
                 return None, "Could not detect CSV encoding."
             
-            # Parse CSV
-            df = pd.read_csv(file_path, encoding=detected_encoding)
+            # Read headers and preview rows without parsing the whole file
+            try:
+                with open(file_path, newline='', encoding=detected_encoding) as f:
+                    reader = csv.reader(f)
+                    headers = next(reader, None)
+                    if headers is None:
+                        return None, "CSV file is empty."
+                    sample_rows = list(itertools.islice(reader, 10))
+                    remaining_rows = sum(1 for _ in reader)
+            except UnicodeDecodeError:
+                return None, f"Could not decode CSV file as {detected_encoding}."
             
             # Convert to text representation
-            text = "CSV Data:\n"
+            parts = ["CSV Data:\n"]
             
             # Add headers
-            text += " | ".join(df.columns) + "\n"
-            text += "-" * 50 + "\n"
+            parts.append(_format_row(headers) + "\n")
+            parts.append("-" * 50 + "\n")
             
             # Add sample rows (first 10)
-            sample_rows = df.head(10).astype(str)
-            for _, row in sample_rows.iterrows():
-                text += " | ".join(row.values) + "\n"
+            for row in sample_rows:
+                parts.append(_format_row(row) + "\n")
             
             # Add summary if there are more rows
-            if len(df) > 10:
-                text += f"\n... and {len(df) - 10} more rows.\n"
+            if remaining_rows:
+                parts.append(f"\n... and {remaining_rows} more rows.\n")
             
             # Add statistics for numeric columns
-            text += "\nSummary Statistics:\n"
-            numeric_cols = df.select_dtypes(include=['number']).columns
-            if len(numeric_cols) > 0:
-                stats = df[numeric_cols].describe().to_string()
-                text += stats + "\n"
+            # The statistics are optional, so failing to compute them leaves
+            # the preview intact
+            if self.include_statistics:
+                try:
+                    stats = self._summary_statistics(file_path, detected_encoding, headers)
+                except Exception as e:
+                    logger.warning(f"Could not compute statistics for CSV {file_path}: {str(e)}")
+                else:
+                    parts.append("\nSummary Statistics:\n")
+                    if stats:
+                        parts.append(stats + "\n")
             
-            return text, None
+            return "".join(parts), None
             
         except Exception as e:
             logger.error(f"Error loading CSV {file_path}: {str(e)}")
             return None, f"Error loading CSV: {str(e)}"
+    
+    def _summary_statistics(self, file_path: str, encoding: str, headers: List[str]) -> str:
+        """Compute summary statistics for numeric columns.
+        
+        Args:
+            file_path: Path to the CSV file
+            encoding: File encoding
+            headers: Header row of the file
+            
+        Returns:
+            Formatted statistics, empty if there are no numeric columns
+        """
+        pyarrow = _get_pyarrow()
+        # pandas renames duplicate headers (a, a.1) and Arrow doesn't, so
+        # such files go through pandas to get the same column names
+        if pyarrow is not None and len(set(headers)) == len(headers):
+            try:
+                return self._arrow_statistics(pyarrow, file_path, encoding)
+            except pyarrow[0].ArrowInvalid as e:
+                # Arrow rejects rows with a different number of columns
+                logger.debug(f"Arrow could not parse {file_path}, using pandas: {str(e)}")
+        
+        return self._pandas_statistics(file_path, encoding)
+    
+    def _pandas_statistics(self, file_path: str, encoding: str) -> str:
+        """Compute summary statistics for numeric columns with pandas.
+        
+        Args:
+            file_path: Path to the CSV file
+            encoding: File encoding
+            
+        Returns:
+            Formatted statistics, empty if there are no numeric columns
+        """
+        import pandas as pd
+        
+        df = pd.read_csv(file_path, encoding=encoding)
+        numeric_cols = df.select_dtypes(include=['number']).columns
+        if len(numeric_cols) == 0:
+            return ""
+        described = df[numeric_cols].describe()
+        return "\n".join(
+            _format_column_stats(str(name), {field: float(described.at[field, name]) for field in _STAT_FIELDS})
+            for name in numeric_cols
+        )
+    
+    def _arrow_statistics(self, pyarrow: Tuple[Any, Any, Any], file_path: str, encoding: str) -> str:
+        """Compute summary statistics for numeric columns with pyarrow.
+        
+        Arrow parses multi-threaded and computes with vectorized kernels.
+        
+        Args:
+            pyarrow: Tuple of (pyarrow, pyarrow.compute, pyarrow.csv)
+            file_path: Path to the CSV file
+            encoding: File encoding
+            
+        Returns:
+            Formatted statistics, empty if there are no numeric columns
+        """
+        pa, pc, pa_csv = pyarrow
+        table = pa_csv.read_csv(file_path, read_options=pa_csv.ReadOptions(encoding=encoding))
+        lines = []
+        for name, column in zip(table.column_names, table.columns):
+            if not (pa.types.is_integer(column.type) or pa.types.is_floating(column.type)):
+                continue
+            min_max = pc.min_max(column)
+            # Linear interpolation matches pandas' quantiles
+            quartiles = pc.quantile(column, q=[0.25, 0.5, 0.75], interpolation='linear').to_pylist()
+            stats = {
+                'count': len(column) - column.null_count,
+                'mean': pc.mean(column).as_py(),
+                'std': pc.stddev(column, ddof=1).as_py(),
+                'min': min_max['min'].as_py(),
+                'max': min_max['max'].as_py(),
+            }
+            stats.update(zip(('25%', '50%', '75%'), quartiles))
+            lines.append(_format_column_stats(name, stats))
+        
+        return "\n".join(lines)
 
 
 class JSONLoader:
     """Handles loading and processing JSON files."""
     
+    def __init__(self, count_items: bool = True):
+        """Initialize loader.
+        
+        Args:
+            count_items: Whether to count all items of top-level arrays. Counting
+                scans the whole file; the preview itself only reads the first items.
+        """
+        self.count_items = count_items
+    
     def load(self, file_path: str) -> Tuple[Optional[str], Optional[str]]:
         """Load and parse JSON file.
         
@@ -259,33 +813,72 @@ class JSONLoader:
             A tuple of (parsed_content, error_message)
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                # Stream top-level arrays so only the previewed items are parsed
+                ijson = _optional_import('ijson')
+                if ijson is not None and f.read(_JSON_PEEK_BYTES).lstrip().startswith(b'['):
+                    f.seek(0)
+                    try:
+                        return self._preview_array(f), None
+                    except ijson.JSONError as e:
+                        # ijson's C backend rejects integers wider than 64 bits
+                        # and NaN, which the full parse accepts
+                        logger.debug(f"Streaming {file_path} failed, parsing it whole: {str(e)}")
+                
+                f.seek(0)
+                data = _json_loads(f.read())
             
             # Convert to formatted text representation
             if isinstance(data, list):
-                text = f"JSON Data (Array with {len(data)} items):\n"
+                parts = [f"JSON Data (Array with {len(data)} items):\n"]
                 
                 # Sample the first few items
                 sample_size = min(5, len(data))
                 for i in range(sample_size):
-                    text += f"Item {i+1}:\n"
-                    text += json.dumps(data[i], indent=2) + "\n\n"
+                    parts.append(f"Item {i+1}:\n")
+                    parts.append(_json_pretty(data[i]) + "\n\n")
                 
                 if len(data) > sample_size:
-                    text += f"... and {len(data) - sample_size} more items.\n"
+                    parts.append(f"... and {len(data) - sample_size} more items.\n")
             else:
-                text = "JSON Data (Object):\n"
-                text += json.dumps(data, indent=2)
+                parts = ["JSON Data (Object):\n", _json_pretty(data)]
             
-            return text, None
+            return "".join(parts), None
             
-        except json.JSONDecodeError as e:
+        except _json_errors() as e:
             logger.error(f"Invalid JSON in {file_path}: {str(e)}")
             return None, f"Invalid JSON: {str(e)}"
         except Exception as e:
             logger.error(f"Error loading JSON {file_path}: {str(e)}")
             return None, f"Error loading JSON: {str(e)}"
+    
+    def _preview_array(self, f) -> str:
+        """Format the first items of a top-level JSON array with ijson.
+        
+        Args:
+            f: JSON file opened in binary mode
+            
+        Returns:
+            Text representation of the array
+        """
+        items = _optional_import('ijson').items(f, 'item', use_float=True)
+        sample = list(itertools.islice(items, 5))
+        
+        if self.count_items:
+            remaining = sum(1 for _ in items)
+            parts = [f"JSON Data (Array with {len(sample) + remaining} items):\n"]
+        else:
+            remaining = 0
+            parts = [f"JSON Data (Array, first {len(sample)} items):\n"]
+        
+        for i, item in enumerate(sample):
+            parts.append(f"Item {i+1}:\n")
+            parts.append(_json_pretty(item) + "\n\n")
+        
+        if remaining:
+            parts.append(f"... and {remaining} more items.\n")
+        
+        return "".join(parts)
 
 
 class ExcelLoader:
@@ -301,73 +894,244 @@ class ExcelLoader:
             A tuple of (parsed_content, error_message)
         """
         try:
-            # Read all sheets
-            xl = pd.ExcelFile(file_path)
+            # openpyxl only reads .xlsx; legacy .xls goes through pandas
+            openpyxl = _optional_import('openpyxl')
+            if openpyxl is None or file_path.lower().endswith('.xls'):
+                return self._load_with_pandas(file_path), None
+            
+            return self._load_with_openpyxl(openpyxl, file_path), None
+            
+        except Exception as e:
+            logger.error(f"Error loading Excel {file_path}: {str(e)}")
+            return None, f"Error loading Excel: {str(e)}"
+    
+    def _load_with_openpyxl(self, openpyxl: Any, file_path: str) -> str:
+        """Build the sheet previews by streaming rows with openpyxl.
+        
+        Args:
+            openpyxl: The openpyxl module
+            file_path: Path to the Excel file
+            
+        Returns:
+            Text representation of the workbook
+        """
+        wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            parts = [f"Excel File with {len(wb.worksheets)} sheets:\n\n"]
+            
+            for ws in wb.worksheets:
+                # Only the header and the first 5 rows are needed
+                rows = list(itertools.islice(ws.iter_rows(values_only=True), 6))
+                headers = rows[0] if rows else ()
+                sample_rows = rows[1:]
+                
+                # Read-only sheets may not record their dimensions
+                if ws.max_row is not None:
+                    row_count = max(ws.max_row - 1, 0)
+                    column_count = ws.max_column
+                else:
+                    row_count = max(sum(1 for _ in ws.iter_rows()) - 1, 0)
+                    column_count = len(headers)
+                
+                parts.append(f"Sheet: {ws.title} ({row_count} rows, {column_count} columns)\n")
+                
+                # Add headers
+                parts.append(_format_row(headers) + "\n")
+                parts.append("-" * 50 + "\n")
+                
+                # Add sample rows (first 5)
+                for row in sample_rows:
+                    parts.append(_format_row(row) + "\n")
+                
+                # Add summary if there are more rows
+                if row_count > 5:
+                    parts.append(f"\n... and {row_count - 5} more rows.\n")
+                
+                parts.append("\n")
+            
+            return "".join(parts)
+        finally:
+            wb.close()
+    
+    def _load_with_pandas(self, file_path: str) -> str:
+        """Build the sheet previews with pandas.
+        
+        Args:
+            file_path: Path to the Excel file
+            
+        Returns:
+            Text representation of the workbook
+        """
+        import pandas as pd
+        
+        # Read all sheets from a single open workbook
+        with pd.ExcelFile(file_path) as xl:
             sheet_names = xl.sheet_names
             
-            text = f"Excel File with {len(sheet_names)} sheets:\n\n"
+            parts = [f"Excel File with {len(sheet_names)} sheets:\n\n"]
             
             for sheet_name in sheet_names:
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
+                df = xl.parse(sheet_name)
                 
-                text += f"Sheet: {sheet_name} ({len(df)} rows, {len(df.columns)} columns)\n"
+                parts.append(f"Sheet: {sheet_name} ({len(df)} rows, {len(df.columns)} columns)\n")
                 
                 # Add headers
-                text += " | ".join(df.columns) + "\n"
-                text += "-" * 50 + "\n"
+                parts.append(_format_row(list(df.columns)) + "\n")
+                parts.append("-" * 50 + "\n")
                 
                 # Add sample rows (first 5)
-                sample_rows = df.head(5).astype(str)
-                for _, row in sample_rows.iterrows():
-                    text += " | ".join(row.values) + "\n"
+                sample_rows = df.iloc[:5, :_MAX_PREVIEW_COLS].astype(str).to_numpy().tolist()
+                parts.extend(_format_row(row, len(df.columns)) + "\n" for row in sample_rows)
                 
                 # Add summary if there are more rows
                 if len(df) > 5:
-                    text += f"\n... and {len(df) - 5} more rows.\n"
+                    parts.append(f"\n... and {len(df) - 5} more rows.\n")
                 
-                text += "\n"
-            
-            return text, None
-            
-        except Exception as e:
-            logger.error(f"Error loading Excel {file_path}: {str(e)}")
-            return None, f"Error loading Excel: {str(e)}"
+                parts.append("\n")
+        
+        return "".join(parts)
 
 
 class DocumentLoader:
     """Main document loading coordinator with support for multiple file types."""
     
-    def __init__(self):
-        """Initialize with components."""
+    def __init__(self,
+                 cache_dir: Optional[str] = None,
+                 cache_max_chars: int = 10_000_000,
+                 cache_max_bytes: int = 256 * 1024 * 1024):
+        """Initialize with components.
+        
+        Args:
+            cache_dir: Directory for cached PDF text. Caching is off by default
+                since documents may hold sensitive data; the directory is
+                created private to the current user.
+            cache_max_chars: Largest extracted text to cache
+            cache_max_bytes: Total size the cache directory is pruned to,
+                least recently used entries first
+        """
         self.validator = DocumentValidator()
+        self.cache_dir = cache_dir
+        self.cache_max_chars = cache_max_chars
+        self.cache_max_bytes = cache_max_bytes
+        # Loader classes are instantiated on first use
         self.loaders = {
-            '.pdf': PDFLoader(),
-            '.docx': DocxLoader(),
-            '.txt': TextLoader(),
-            '.csv': CSVLoader(),
-            '.json': JSONLoader(),
-            '.xlsx': ExcelLoader(),
-            '.xls': ExcelLoader(),
-            '.md': TextLoader(),  # Treat markdown as text
+            '.pdf': PDFLoader,
+            '.docx': DocxLoader,
+            '.txt': TextLoader,
+            '.csv': CSVLoader,
+            '.json': JSONLoader,
+            '.xlsx': ExcelLoader,
+            '.xls': ExcelLoader,
+            '.md': TextLoader,  # Treat markdown as text
         }
     
-    def load_documents(self, file_paths: List[str]) -> List[LoaderResult]:
+    def load_documents(self, file_paths: List[str], max_workers: Optional[int] = None) -> List[LoaderResult]:
         """Load multiple documents with validation and detailed results.
         
+        Files are loaded concurrently: PDF, Excel and CSV files go to a
+        process pool since their parsers are CPU-bound Python, everything
+        else to a thread pool.
+        
         Args:
             file_paths: List of file paths to load
+            max_workers: Maximum number of workers per pool (defaults to CPU count)
             
         Returns:
-            List of LoaderResult objects
+            List of LoaderResult objects, in the same order as file_paths
         """
-        results = []
-        
-        for file_path in file_paths:
-            result = self.load_single_document(file_path)
-            results.append(result)
-                
+        results: List[Optional[LoaderResult]] = [None] * len(file_paths)
+        for i, result in self._iter_load_indexed(file_paths, max_workers):
+            results[i] = result
         return results
     
+    def iter_load_documents(self, file_paths: List[str],
+                            max_workers: Optional[int] = None) -> Iterator[Tuple[str, LoaderResult]]:
+        """Load multiple documents, yielding each result as soon as it's ready.
+        
+        Uses the same pools as load_documents, but results come in
+        completion order so callers can show progress before the slowest
+        file finishes.
+        
+        Args:
+            file_paths: List of file paths to load
+            max_workers: Maximum number of workers per pool (defaults to CPU count)
+            
+        Yields:
+            Tuples of (file_path, LoaderResult) in completion order
+        """
+        for i, result in self._iter_load_indexed(file_paths, max_workers):
+            yield file_paths[i], result
+    
+    def _iter_load_indexed(self, file_paths: List[str],
+                           max_workers: Optional[int]) -> Iterator[Tuple[int, LoaderResult]]:
+        """Load documents concurrently, yielding results in completion order.
+        
+        Args:
+            file_paths: List of file paths to load
+            max_workers: Maximum number of workers per pool (defaults to CPU count)
+            
+        Yields:
+            Tuples of (index into file_paths, LoaderResult)
+        """
+        if len(file_paths) <= 1:
+            for i, file_path in enumerate(file_paths):
+                yield i, self.load_single_document(file_path)
+            return
+        
+        max_workers = max_workers or os.cpu_count() or 1
+        
+        # Split files by whether parsing them is worth a separate process
+        process_indices = []
+        thread_indices = []
+        for i, file_path in enumerate(file_paths):
+            if _file_extension(file_path) in _PROCESS_POOL_EXTENSIONS:
+                process_indices.append(i)
+            else:
+                thread_indices.append(i)
+        
+        # A single heavy file doesn't justify starting a process pool
+        if len(process_indices) < 2:
+            thread_indices.extend(process_indices)
+            process_indices = []
+        
+        thread_pool = ThreadPoolExecutor(max_workers=max_workers)
+        process_pool = None
+        try:
+            futures = {
+                thread_pool.submit(self.load_single_document, file_paths[i]): i
+                for i in thread_indices
+            }
+            process_futures = set()
+            if process_indices:
+                # Forking a multithreaded process (e.g. under Streamlit) can
+                # deadlock the child on locks held by other threads, so spawn
+                process_pool = ProcessPoolExecutor(
+                    max_workers=min(max_workers, len(process_indices)),
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+                for i in process_indices:
+                    future = process_pool.submit(self.load_single_document, file_paths[i])
+                    futures[future] = i
+                    process_futures.add(future)
+            
+            for future in as_completed(futures):
+                i = futures[future]
+                if future not in process_futures:
+                    yield i, future.result()
+                    continue
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Worker crashed or result couldn't be pickled, load in-process instead
+                    logger.warning(f"Worker failed loading {file_paths[i]}, retrying in-process: {str(e)}")
+                    result = self.load_single_document(file_paths[i])
+                yield i, result
+        finally:
+            # Don't start queued files if the caller stopped iterating
+            thread_pool.shutdown(cancel_futures=True)
+            if process_pool is not None:
+                process_pool.shutdown(cancel_futures=True)
+    
     def load_single_document(self, file_path: str) -> LoaderResult:
         """Load a single document with validation and detailed result.
         
@@ -377,15 +1141,21 @@ class DocumentLoader:
         Returns:
             LoaderResult object
         """
+        # Stat once and share the result with validation, caching and metadata
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            st = None
+        
         # Validate file path
-        is_valid, error_message = self.validator.validate_file_path(file_path)
+        is_valid, error_message = self.validator.validate_file_path(file_path, st)
         if not is_valid:
             logger.error(f"File validation failed for {file_path}: {error_message}")
             return LoaderResult(success=False, error_message=error_message)
         
         try:
             # Get file extension
-            extension = os.path.splitext(file_path)[1].lower()
+            extension = _file_extension(file_path)
             
             # Get appropriate loader
             loader = self.loaders.get(extension)
@@ -393,11 +1163,23 @@ class DocumentLoader:
                 error_message = f"No loader found for extension: {extension}"
                 logger.error(error_message)
                 return LoaderResult(success=False, error_message=error_message)
+            if isinstance(loader, type):
+                self.loaders[extension] = loader = loader()
+            
+            # Load content, reusing cached text for expensive formats
+            cache_key = None
+            content = None
+            if self.cache_dir and extension in _CACHED_EXTENSIONS:
+                cache_key = self._cache_key(file_path, st)
+                content = self._read_cache(cache_key)
             
-            # Load content
-            content, load_error = loader.load(file_path)
-            if load_error:
-                return LoaderResult(success=False, error_message=load_error)
+            if content is None:
+                content, load_error = loader.load(file_path)
+                if load_error:
+                    return LoaderResult(success=False, error_message=load_error)
+                
+                if cache_key and len(content) <= self.cache_max_chars:
+                    self._write_cache(cache_key, content)
             
             # Validate content
             is_valid, content_error = self.validator.validate_content(content)
@@ -408,7 +1190,7 @@ class DocumentLoader:
             warning = content_error if is_valid and content_error else None
             document = Document(
                 page_content=content,
-                metadata=self._create_metadata(file_path, extension)
+                metadata=self._create_metadata(file_path, extension, st)
             )
             
             return LoaderResult(success=True, document=document, warning=warning)
@@ -420,45 +1202,127 @@ class DocumentLoader:
                 error_message=f"Unexpected error loading document: {str(e)}"
             )
     
-    def _create_metadata(self, file_path: str, extension: str) -> Dict[str, Any]:
+    def _cache_key(self, file_path: str, st: os.stat_result) -> str:
+        """Build a cache key that changes whenever the file does.
+        
+        Args:
+            file_path: Path to the file
+            st: Result of os.stat for the file
+            
+        Returns:
+            Cache key
+        """
+        key = f"{os.path.abspath(file_path)}:{st.st_mtime_ns}:{st.st_size}"
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=20).hexdigest()
+    
+    def _read_cache(self, cache_key: str) -> Optional[str]:
+        """Read cached text.
+        
+        Args:
+            cache_key: Cache key
+            
+        Returns:
+            Cached text or None on a miss
+        """
+        cache_path = os.path.join(self.cache_dir, cache_key + _CACHE_SUFFIX)
+        try:
+            with gzip.open(cache_path, 'rt', encoding='utf-8') as f:
+                content = f.read()
+            # Mark the entry as recently used for pruning
+            os.utime(cache_path)
+            return content
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {cache_path}: {str(e)}")
+            return None
+    
+    def _write_cache(self, cache_key: str, content: str) -> None:
+        """Write text to the cache atomically.
+        
+        Args:
+            cache_key: Cache key
+            content: Text to cache
+        """
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as raw, gzip.open(raw, 'wt', encoding='utf-8') as f:
+                    f.write(content)
+                os.replace(tmp_path, os.path.join(self.cache_dir, cache_key + _CACHE_SUFFIX))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            logger.warning(f"Could not write cache entry for {cache_key}: {str(e)}")
+            return
+        
+        self._prune_cache()
+    
+    def _prune_cache(self) -> None:
+        """Delete the least recently used cache entries over cache_max_bytes."""
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(_CACHE_SUFFIX):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+        except OSError as e:
+            logger.warning(f"Could not scan cache directory {self.cache_dir}: {str(e)}")
+            return
+        
+        total = sum(size for _, size, _ in entries)
+        if total <= self.cache_max_bytes:
+            return
+        
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not delete cache entry {path}: {str(e)}")
+                continue
+            total -= size
+            if total <= self.cache_max_bytes:
+                break
+    
+    def _create_metadata(self, file_path: str, extension: str,
+                         st: Optional[os.stat_result] = None) -> Dict[str, Any]:
         """Create metadata for document with enhanced information.
         
         Args:
             file_path: Path to the file
             extension: File extension
+            st: Result of os.stat for the file, fetched if not given
             
         Returns:
             Document metadata
         """
         # Get file stats
-        file_size = os.path.getsize(file_path)
-        modified_time = os.path.getmtime(file_path)
-        created_time = os.path.getctime(file_path)
-        
-        # Set document type based on extension
-        doc_type = "unknown"
-        if extension in ['.pdf']:
-            doc_type = "pdf"
-        elif extension in ['.docx', '.doc']:
-            doc_type = "document"
-        elif extension in ['.txt', '.md']:
-            doc_type = "text"
-        elif extension in ['.csv']:
-            doc_type = "spreadsheet"
-        elif extension in ['.xlsx', '.xls']:
-            doc_type = "spreadsheet"
-        elif extension in ['.json']:
-            doc_type = "data"
+        if st is None:
+            st = os.stat(file_path)
+        file_size = st.st_size
+        modified_time = st.st_mtime
+        created_time = st.st_ctime
+        file_name = os.path.basename(file_path)
         
         # Create metadata
         return {
             "source": file_path,
             "file_type": extension,
-            "document_type": doc_type,
-            "file_name": os.path.basename(file_path),
+            "document_type": _EXT_TO_DOCTYPE.get(extension, "unknown"),
+            "file_name": file_name,
             "file_size": file_size,
             "file_size_mb": round(file_size / (1024 * 1024), 2),
             "last_modified": modified_time,
             "created": created_time,
-            "id": f"doc_{os.path.basename(file_path)}_{int(modified_time)}"
+            "id": f"doc_{file_name}_{int(modified_time)}"
         }
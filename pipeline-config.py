@@ -1,21 +1,161 @@
 import os
 import yaml
 import json
-from typing import Dict, Any, Optional, List, Union
+import re
+import hashlib
+import tempfile
+from typing import Dict, Any, Optional, List, Union, Tuple, Iterator, Iterable
 from dataclasses import dataclass, field
 from utils.logging_config import get_module_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Create a logger for this module
 logger = get_module_logger("pipeline_config")
 
-@dataclass
+# libyaml's C loader and dumper are several times faster when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+# A run of digits long enough to overflow 64 bits; orjson reads such
+# integers as floats, losing precision
+_WIDE_INT_RE = re.compile(rb'\d{19,}')
+
+# Parsed YAML configs are cached as JSON in a private per-user directory,
+# keyed by a hash of the file contents. Bump the version to drop old entries.
+_YAML_CACHE_VERSION = b"3"
+_YAML_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "tlav",
+    "pipeline_configs"
+)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON, with orjson when it reads the document exactly.
+    
+    Args:
+        data: UTF-8 encoded JSON
+        
+    Returns:
+        Parsed data
+    """
+    if orjson is not None and not _WIDE_INT_RE.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN and Infinity, which the json module accepts
+            pass
+    return json.loads(data)
+
+
+def _yaml_cache_dir() -> Optional[str]:
+    """Get the YAML cache directory, creating it if needed.
+    
+    Returns:
+        Directory path, or None if it can't be created or could be written
+        by other users
+    """
+    try:
+        os.makedirs(_YAML_CACHE_DIR, mode=0o700, exist_ok=True)
+        st = os.stat(_YAML_CACHE_DIR)
+    except OSError as e:
+        logger.debug(f"Config cache directory unavailable: {str(e)}")
+        return None
+    
+    if hasattr(os, "getuid") and (st.st_uid != os.getuid() or st.st_mode & 0o022):
+        logger.warning(f"Not using config cache {_YAML_CACHE_DIR}: not private to this user")
+        return None
+    return _YAML_CACHE_DIR
+
+
+def _yaml_cache_path(cache_dir: str, content: bytes) -> str:
+    """Get the cache file path for a YAML document.
+    
+    Args:
+        cache_dir: Cache directory
+        content: Raw YAML file content
+        
+    Returns:
+        Cache file path
+    """
+    digest = hashlib.blake2b(_YAML_CACHE_VERSION + b"\0" + content, digest_size=20).hexdigest()
+    return os.path.join(cache_dir, f"{digest}.json")
+
+
+def _read_yaml_cache(content: bytes) -> Optional[Dict[str, Any]]:
+    """Read the cached parse of a YAML document.
+    
+    Args:
+        content: Raw YAML file content
+        
+    Returns:
+        Parsed configuration dictionary or None on a miss
+    """
+    cache_dir = _yaml_cache_dir()
+    if cache_dir is None:
+        return None
+    
+    try:
+        with open(_yaml_cache_path(cache_dir, content), "rb") as f:
+            config_dict = json.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable config cache entry: {str(e)}")
+        return None
+    
+    return config_dict if isinstance(config_dict, dict) else None
+
+
+def _write_yaml_cache(content: bytes, config_dict: Dict[str, Any]) -> None:
+    """Cache the parse of a YAML document.
+    
+    Documents that don't survive a JSON round trip unchanged (dates,
+    non-string keys and the like) aren't cached.
+    
+    Args:
+        content: Raw YAML file content
+        config_dict: Parsed configuration dictionary
+    """
+    try:
+        data = json.dumps(config_dict)
+        if json.loads(data) != config_dict:
+            return
+    except (TypeError, ValueError):
+        return
+    
+    cache_dir = _yaml_cache_dir()
+    if cache_dir is None:
+        return
+    
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            # Atomic, so readers never see a half-written entry
+            os.replace(tmp_path, _yaml_cache_path(cache_dir, content))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        logger.debug(f"Could not write config cache entry: {str(e)}")
+
+
+@dataclass(slots=True)
 class ComponentConfig:
     """Configuration for a pipeline component."""
     type: str
     params: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineStageConfig:
     """Configuration for a pipeline stage."""
     components: Dict[str, ComponentConfig] = field(default_factory=dict)
@@ -32,15 +172,21 @@ class PipelineStageConfig:
         """
         components = {}
         for name, comp_config in config_dict.items():
-            if isinstance(comp_config, dict):
+            # Entries are almost always dicts; skip the rare ones that aren't
+            try:
                 comp_type = comp_config.get("type", "default")
                 comp_params = comp_config.get("params", {})
-                components[name] = ComponentConfig(comp_type, comp_params)
+            except AttributeError:
+                continue
+            # Copy params so configs built from one dict don't share them
+            if isinstance(comp_params, dict):
+                comp_params = dict(comp_params)
+            components[name] = ComponentConfig(comp_type, comp_params)
         
         return cls(components)
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineConfig:
     """Configuration for a pipeline."""
     name: str
@@ -87,8 +233,14 @@ class PipelineConfig:
             PipelineConfig instance
         """
         try:
-            with open(yaml_path, "r") as f:
-                config_dict = yaml.safe_load(f)
+            with open(yaml_path, "rb") as f:
+                content = f.read()
+            
+            # Reuse an earlier parse of identical content
+            config_dict = _read_yaml_cache(content)
+            if config_dict is None:
+                config_dict = yaml.load(content, Loader=_SafeLoader)
+                _write_yaml_cache(content, config_dict)
             
             return cls.from_dict(config_dict)
         except Exception as e:
@@ -107,8 +259,8 @@ class PipelineConfig:
             PipelineConfig instance
         """
         try:
-            with open(json_path, "r") as f:
-                config_dict = json.load(f)
+            with open(json_path, "rb") as f:
+                config_dict = _json_loads(f.read())
             
             return cls.from_dict(config_dict)
         except Exception as e:
@@ -122,24 +274,53 @@ class PipelineConfig:
         Returns:
             Configuration dictionary
         """
-        stages_dict = {}
-        for stage_name, stage_config in self.stages.items():
-            components_dict = {}
-            for comp_name, comp_config in stage_config.components.items():
-                components_dict[comp_name] = {
-                    "type": comp_config.type,
-                    "params": comp_config.params
-                }
-            stages_dict[stage_name] = components_dict
-        
         return {
             "name": self.name,
             "version": self.version,
             "description": self.description,
-            "stages": stages_dict,
+            "stages": dict(self._iter_stages()),
             "environment": self.environment
         }
     
+    def _iter_stages(self) -> Iterator[Tuple[str, Dict[str, Dict[str, Any]]]]:
+        """Iterate over stages in their dictionary form.
+        
+        Yields:
+            Tuples of (stage_name, {component_name: {"type": ..., "params": ...}})
+        """
+        for stage_name, stage_config in self.stages.items():
+            yield stage_name, {
+                comp_name: {"type": comp_config.type, "params": comp_config.params}
+                for comp_name, comp_config in stage_config.components.items()
+            }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to indented JSON.
+        
+        With orjson, ComponentConfig dataclasses are serialized natively, so
+        no per-component dicts are built.
+        
+        Returns:
+            UTF-8 encoded JSON
+        """
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    {
+                        "name": self.name,
+                        "version": self.version,
+                        "description": self.description,
+                        "stages": {name: stage.components for name, stage in self.stages.items()},
+                        "environment": self.environment
+                    },
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            except TypeError:
+                # orjson rejects integers wider than 64 bits
+                pass
+        
+        return json.dumps(self.to_dict(), indent=2).encode("utf-8")
+    
     def to_yaml(self, yaml_path: str) -> bool:
         """Save configuration to a YAML file.
         
@@ -153,7 +334,7 @@ class PipelineConfig:
             config_dict = self.to_dict()
             
             with open(yaml_path, "w") as f:
-                yaml.dump(config_dict, f, default_flow_style=False)
+                yaml.dump(config_dict, f, Dumper=_SafeDumper, default_flow_style=False)
             
             return True
         except Exception as e:
@@ -170,10 +351,10 @@ class PipelineConfig:
             Success status
         """
         try:
-            config_dict = self.to_dict()
+            data = self.to_json_bytes()
             
-            with open(json_path, "w") as f:
-                json.dump(config_dict, f, indent=2)
+            with open(json_path, "wb") as f:
+                f.write(data)
             
             return True
         except Exception as e:
@@ -214,6 +395,28 @@ class PipelineConfig:
         
         return comp_config.params.get(param, default)
     
+    def get_component_params(self, stage: str, component: str, params: Iterable[str],
+                             defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Get several parameter values for a specific component.
+        
+        Args:
+            stage: Pipeline stage
+            component: Component name
+            params: Parameter names
+            defaults: Default values by parameter name for missing parameters
+            
+        Returns:
+            Dictionary of parameter name to value, None for missing
+            parameters without a default
+        """
+        defaults = defaults or {}
+        comp_config = self.get_component_config(stage, component)
+        if not comp_config:
+            return {name: defaults.get(name) for name in params}
+        
+        comp_params = comp_config.params
+        return {name: comp_params.get(name, defaults.get(name)) for name in params}
+    
     def set_component_param(self, stage: str, component: str, param: str, value: Any) -> bool:
         """Set a parameter value for a specific component.
         
@@ -238,6 +441,13 @@ class PipelineConfig:
         return True
 
 
+# Config file extensions, in order of precedence when a name has several
+_CONFIG_EXTENSIONS = {".yaml": 0, ".yml": 1, ".json": 2}
+
+# Bytes read from a JSON config to check that it holds an object
+_JSON_PEEK_BYTES = 64
+
+
 class ConfigManager:
     """Manages pipeline configurations."""
     
@@ -245,8 +455,12 @@ class ConfigManager:
         self.config_dir = config_dir
         self.configs: Dict[str, PipelineConfig] = {}
         
-        # Create config directory if it doesn't exist
-        os.makedirs(config_dir, exist_ok=True)
+        # Config name -> file path, rescanned only when the directory changes
+        self._index: Dict[str, str] = {}
+        self._index_mtime: Optional[int] = None
+        
+        # The config directory is created on first save
+        self._dir_ready = False
         
         logger.debug(f"Initialized config manager with directory: {config_dir}")
     
@@ -263,22 +477,51 @@ class ConfigManager:
         if name in self.configs:
             return self.configs[name]
         
-        # Try YAML first
-        yaml_path = os.path.join(self.config_dir, f"{name}.yaml")
-        if os.path.exists(yaml_path):
-            config = PipelineConfig.from_yaml(yaml_path)
-            self.configs[name] = config
-            return config
-        
-        # Try JSON next
-        json_path = os.path.join(self.config_dir, f"{name}.json")
-        if os.path.exists(json_path):
-            config = PipelineConfig.from_json(json_path)
-            self.configs[name] = config
-            return config
-        
-        logger.warning(f"Configuration '{name}' not found")
-        return None
+        # Find the file in the index and only parse it now
+        self._refresh_index()
+        path = self._index.get(name)
+        if path is None:
+            logger.warning(f"Configuration '{name}' not found")
+            return None
+        
+        # Reject empty and obviously malformed files without parsing them
+        try:
+            empty = os.path.getsize(path) == 0
+        except OSError:
+            empty = False
+        
+        if empty:
+            logger.warning(f"Configuration file {path} is empty, using defaults")
+            config = PipelineConfig(name=name, version="0.1.0")
+        elif path.endswith(".json"):
+            if self._looks_like_json_object(path):
+                config = PipelineConfig.from_json(path)
+            else:
+                logger.error(f"Error loading configuration from {path}: not a JSON object")
+                config = PipelineConfig(name="default", version="0.1.0")
+        else:
+            config = PipelineConfig.from_yaml(path)
+        self.configs[name] = config
+        return config
+    
+    @staticmethod
+    def _looks_like_json_object(json_path: str) -> bool:
+        """Check whether a JSON file starts like an object.
+        
+        Args:
+            json_path: Path to JSON file
+            
+        Returns:
+            False if the file clearly isn't a JSON object, True otherwise
+        """
+        try:
+            with open(json_path, "rb") as f:
+                head = f.read(_JSON_PEEK_BYTES).lstrip()
+        except OSError:
+            # Let the parser report the error
+            return True
+        
+        return not head or head.startswith(b"{")
     
     def save_config(self, config: PipelineConfig, format: str = "yaml") -> bool:
         """Save a pipeline configuration.
@@ -293,6 +536,15 @@ class ConfigManager:
         # Save to cache
         self.configs[config.name] = config
         
+        # Create config directory if it doesn't exist
+        if not self._dir_ready:
+            try:
+                os.makedirs(self.config_dir, exist_ok=True)
+            except OSError as e:
+                logger.error(f"Error creating config directory {self.config_dir}: {str(e)}")
+                return False
+            self._dir_ready = True
+        
         # Save to file
         if format.lower() == "json":
             path = os.path.join(self.config_dir, f"{config.name}.json")
@@ -307,19 +559,36 @@ class ConfigManager:
         Returns:
             List of configuration names
         """
-        configs = []
-        
-        # Check for YAML files
-        for filename in os.listdir(self.config_dir):
-            if filename.endswith(".yaml") or filename.endswith(".yml"):
-                name = os.path.splitext(filename)[0]
-                configs.append(name)
-            elif filename.endswith(".json"):
-                name = os.path.splitext(filename)[0]
-                if name not in configs:  # Avoid duplicates if both YAML and JSON exist
-                    configs.append(name)
-        
-        return configs
+        self._refresh_index()
+        return list(self._index)
+    
+    def _refresh_index(self) -> None:
+        """Rescan the config directory if it changed since the last scan."""
+        try:
+            mtime = os.stat(self.config_dir).st_mtime_ns
+        except FileNotFoundError:
+            self._index = {}
+            self._index_mtime = None
+            return
+        
+        if mtime == self._index_mtime:
+            return
+        
+        # Map each name to its file, preferring YAML when both exist
+        index: Dict[str, str] = {}
+        with os.scandir(self.config_dir) as entries:
+            for entry in entries:
+                name, ext = os.path.splitext(entry.name)
+                rank = _CONFIG_EXTENSIONS.get(ext)
+                # is_file() uses the type from the directory listing, no stat
+                if rank is None or not entry.is_file():
+                    continue
+                current = index.get(name)
+                if current is None or rank < _CONFIG_EXTENSIONS[os.path.splitext(current)[1]]:
+                    index[name] = entry.path
+        
+        self._index = index
+        self._index_mtime = mtime
     
     def create_config(self, name: str, version: str = "0.1.0", description: str = "") -> PipelineConfig:
         """Create a new pipeline configuration.
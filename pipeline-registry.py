@@ -1,5 +1,6 @@
 import inspect
-from typing import Dict, Any, Type, List, Optional, Callable, TypeVar, Generic
+import sys
+from typing import Dict, Any, Type, List, Optional, Callable, TypeVar, Generic, FrozenSet
 from utils.logging_config import get_module_logger
 
 # Create a logger for this module
@@ -13,6 +14,8 @@ class ComponentRegistry(Generic[T]):
     def __init__(self, component_type: str):
         self.component_type = component_type
         self.components: Dict[str, Type[T]] = {}
+        # Factory per component, specialized to its constructor at registration
+        self._factories: Dict[str, Callable[[Dict[str, Any]], T]] = {}
         logger.debug(f"Initialized {component_type} registry")
     
     def register(self, name: str, component_class: Type[T]) -> Type[T]:
@@ -27,11 +30,50 @@ class ComponentRegistry(Generic[T]):
         """
         if name in self.components:
             logger.warning(f"{self.component_type} component '{name}' already registered, overwriting")
-            
+        
+        # Interned keys match identifier-like literals by identity on lookup
+        name = sys.intern(name)
         self.components[name] = component_class
+        try:
+            self._factories[name] = self._make_factory(component_class)
+        except (TypeError, ValueError):
+            # Signature not available; create() reports it when used
+            self._factories.pop(name, None)
         logger.debug(f"Registered {self.component_type} component: {name}")
         return component_class
     
+    @staticmethod
+    def _constructor_params(component_class: Type[T]) -> FrozenSet[str]:
+        """Get the parameter names accepted by a component's constructor.
+        
+        Args:
+            component_class: Component class
+            
+        Returns:
+            Parameter names
+        """
+        return frozenset(inspect.signature(component_class.__init__).parameters)
+    
+    @classmethod
+    def _make_factory(cls, component_class: Type[T]) -> Callable[[Dict[str, Any]], T]:
+        """Build a factory that creates a component from unfiltered kwargs.
+        
+        Args:
+            component_class: Component class
+            
+        Returns:
+            Function taking a kwargs dict and returning a component instance
+        """
+        allowed = cls._constructor_params(component_class)
+        
+        def factory(kwargs: Dict[str, Any]) -> T:
+            # Pass kwargs through untouched when they all fit the constructor
+            if kwargs.keys() <= allowed:
+                return component_class(**kwargs)
+            return component_class(**{k: kwargs[k] for k in kwargs.keys() & allowed})
+        
+        return factory
+    
     def register_decorator(self, name: str) -> Callable[[Type[T]], Type[T]]:
         """Create a decorator to register a component.
         
@@ -82,16 +124,14 @@ class ComponentRegistry(Generic[T]):
             return None
             
         try:
-            # Get constructor signature
-            sig = inspect.signature(component_class.__init__)
-            params = sig.parameters
-            
-            # Filter kwargs to only include valid parameters
-            valid_kwargs = {k: v for k, v in kwargs.items() if k in params}
+            # Use the factory built at registration, which filters kwargs
+            # to only include valid parameters
+            factory = self._factories.get(name)
+            if factory is None:
+                factory = self._make_factory(component_class)
             
             # Create instance
-            instance = component_class(**valid_kwargs)
-            return instance
+            return factory(kwargs)
         except Exception as e:
             logger.error(f"Error creating {self.component_type} component '{name}': {str(e)}")
             return None
@@ -106,16 +146,20 @@ class PipelineRegistry:
     def create_registry(cls, component_type: str) -> ComponentRegistry:
         """Create a registry for a component type.
         
+        Returns the existing registry if there already is one, so it's
+        safe to call repeatedly.
+        
         Args:
             component_type: Type of components in the registry
             
         Returns:
             Component registry
         """
-        if component_type in cls._registries:
-            logger.warning(f"Registry for '{component_type}' already exists, returning existing one")
-            return cls._registries[component_type]
+        registry = cls._registries.get(component_type)
+        if registry is not None:
+            return registry
             
+        component_type = sys.intern(component_type)
         registry = ComponentRegistry(component_type)
         cls._registries[component_type] = registry
         return registry
@@ -213,45 +257,22 @@ class PipelineRegistry:
         return registry.list()
 
 
-# Create decorator functions for common component types
-def document_processor(name: str):
-    """Decorator to register a document processor."""
-    registry = PipelineRegistry.get_registry("document_processor")
-    if registry is None:
-        registry = PipelineRegistry.create_registry("document_processor")
-    return registry.register_decorator(name)
-
-def embedding_generator(name: str):
-    """Decorator to register an embedding generator."""
-    registry = PipelineRegistry.get_registry("embedding_generator")
-    if registry is None:
-        registry = PipelineRegistry.create_registry("embedding_generator")
-    return registry.register_decorator(name)
-
-def vector_store(name: str):
-    """Decorator to register a vector store."""
-    registry = PipelineRegistry.get_registry("vector_store")
-    if registry is None:
-        registry = PipelineRegistry.create_registry("vector_store")
-    return registry.register_decorator(name)
-
-def llm_provider(name: str):
-    """Decorator to register an LLM provider."""
-    registry = PipelineRegistry.get_registry("llm_provider")
-    if registry is None:
-        registry = PipelineRegistry.create_registry("llm_provider")
-    return registry.register_decorator(name)
-
-def retriever(name: str):
-    """Decorator to register a retriever."""
-    registry = PipelineRegistry.get_registry("retriever")
-    if registry is None:
-        registry = PipelineRegistry.create_registry("retriever")
-    return registry.register_decorator(name)
+# Registries for common component types, created once at import
+_REGISTRY_TYPES = (
+    "document_processor",
+    "embedding_generator",
+    "vector_store",
+    "llm_provider",
+    "retriever",
+    "rag_chain",
+)
+_REGISTRIES = {component_type: PipelineRegistry.create_registry(component_type)
+               for component_type in _REGISTRY_TYPES}
 
-def rag_chain(name: str):
-    """Decorator to register a RAG chain."""
-    registry = PipelineRegistry.get_registry("rag_chain")
-    if registry is None:
-        registry = PipelineRegistry.create_registry("rag_chain")
-    return registry.register_decorator(name)
+# Decorators to register common component types, bound directly to their registry
+document_processor = _REGISTRIES["document_processor"].register_decorator
+embedding_generator = _REGISTRIES["embedding_generator"].register_decorator
+vector_store = _REGISTRIES["vector_store"].register_decorator
+llm_provider = _REGISTRIES["llm_provider"].register_decorator
+retriever = _REGISTRIES["retriever"].register_decorator
+rag_chain = _REGISTRIES["rag_chain"].register_decorator
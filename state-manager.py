@@ -14,12 +14,46 @@ logger = get_module_logger("state_manager")
 
 T = TypeVar('T')
 
+# Session keys kept across a full clear
+_PRESERVED_KEYS = ("user_id", "session_id", "session_start")
+
+# Session keys left out of exports: large objects, and optionally system state
+_EXPORT_EXCLUDED_KEYS = frozenset({"_lock", "vector_store", "chain", "llm_client"})
+_EXPORT_EXCLUDED_KEYS_NO_SYSTEM = _EXPORT_EXCLUDED_KEYS | {"system_state"}
+
+# Session keys holding messages whose timestamps are stored as epoch nanoseconds
+_MESSAGE_KEYS = ("errors", "warnings")
+
+
+def _format_timestamp(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Get a message with its nanosecond timestamp formatted as ISO 8601.
+    
+    Args:
+        message: Message with a "timestamp" in epoch nanoseconds
+        
+    Returns:
+        Copy of the message with an ISO timestamp, or the message itself
+        if its timestamp is already a string
+    """
+    timestamp = message.get("timestamp")
+    if not isinstance(timestamp, int):
+        return message
+    seconds, nanos = divmod(timestamp, 1_000_000_000)
+    iso = datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000).isoformat()
+    return {**message, "timestamp": iso}
+
 class StateValidationError(Exception):
     """Exception raised for state validation errors."""
     pass
 
 class SessionState(Generic[T]):
-    """Thread-safe session state management."""
+    """Thread-safe session state management.
+    
+    Reads don't take the lock: replacing the value is a single reference
+    assignment, so a reader sees either the old or the new value. Treat
+    values as immutable; for values that are modified in place, use
+    LockedSessionState.
+    """
     
     def __init__(self, init_value: T, validator: Optional[Callable[[T], bool]] = None):
         """Initialize with initial value and optional validator.
@@ -38,8 +72,7 @@ class SessionState(Generic[T]):
         Returns:
             Current value
         """
-        with self.lock:
-            return self.value
+        return self.value
     
     def set(self, new_value: T) -> None:
         """Set a new value with validation (thread-safe).
@@ -56,6 +89,19 @@ class SessionState(Generic[T]):
             self.value = new_value
 
 
+class LockedSessionState(SessionState[T]):
+    """Session state whose reads also take the lock, for mutable values."""
+    
+    def get(self) -> T:
+        """Get the current value (thread-safe).
+        
+        Returns:
+            Current value
+        """
+        with self.lock:
+            return self.value
+
+
 class AppStateManager:
     """Manages application state with validation and persistence."""
     
@@ -157,21 +203,15 @@ class AppStateManager:
         """
         if key is None:
             # Preserve user ID and session info when clearing
-            user_id = st.session_state.get("user_id")
-            session_id = st.session_state.get("session_id")
-            session_start = st.session_state.get("session_start")
+            session_state = st.session_state
+            preserved = {k: session_state[k] for k in _PRESERVED_KEYS if k in session_state}
             
-            # Clear all state
-            for k in list(st.session_state.keys()):
-                del st.session_state[k]
+            # Clear all state and reinitialize with defaults
+            session_state.clear()
+            self._initialize_session_state()
             
             # Restore user and session info
-            st.session_state["user_id"] = user_id
-            st.session_state["session_id"] = session_id
-            st.session_state["session_start"] = session_start
-            
-            # Reinitialize with defaults
-            self._initialize_session_state()
+            session_state.update(preserved)
         elif key in st.session_state:
             del st.session_state[key]
     
@@ -181,8 +221,8 @@ class AppStateManager:
         Args:
             error: Error message
         """
-        timestamp = datetime.now().isoformat()
-        self.append("errors", {"message": error, "timestamp": timestamp})
+        # Formatted when read, not on every append
+        self.append("errors", {"message": error, "timestamp": time.time_ns()})
         logger.error(f"UI Error: {error}")
     
     def add_warning(self, warning: str) -> None:
@@ -191,8 +231,8 @@ class AppStateManager:
         Args:
             warning: Warning message
         """
-        timestamp = datetime.now().isoformat()
-        self.append("warnings", {"message": warning, "timestamp": timestamp})
+        # Formatted when read, not on every append
+        self.append("warnings", {"message": warning, "timestamp": time.time_ns()})
         logger.warning(f"UI Warning: {warning}")
     
     def has_errors(self) -> bool:
@@ -210,7 +250,7 @@ class AppStateManager:
             Latest error or None if no errors
         """
         errors = self.get("errors", [])
-        return errors[-1] if errors else None
+        return _format_timestamp(errors[-1]) if errors else None
     
     def clear_errors(self) -> None:
         """Clear all error messages."""
@@ -256,15 +296,16 @@ class AppStateManager:
             Dictionary with session state
         """
         # Get all keys except for large objects and system state
-        excluded_keys = {"_lock", "vector_store", "chain", "llm_client"}
-        if not include_system_state:
-            excluded_keys.add("system_state")
+        excluded_keys = _EXPORT_EXCLUDED_KEYS if include_system_state else _EXPORT_EXCLUDED_KEYS_NO_SYSTEM
         
         # Copy state
-        state_copy = {}
-        for key, value in st.session_state.items():
-            if key not in excluded_keys:
-                state_copy[key] = value
+        state_copy = {key: value for key, value in st.session_state.items() if key not in excluded_keys}
+        
+        # Format message timestamps for persistence
+        for key in _MESSAGE_KEYS:
+            messages = state_copy.get(key)
+            if messages:
+                state_copy[key] = [_format_timestamp(message) for message in messages]
         
         return state_copy
     
@@ -274,8 +315,12 @@ class AppStateManager:
         Args:
             state_dict: Dictionary with session state
         """
-        for key, value in state_dict.items():
-            st.session_state[key] = value
+        # Apply in one update, skipping values that are already in place
+        session_state = st.session_state
+        missing = object()
+        to_apply = {k: v for k, v in state_dict.items() if session_state.get(k, missing) is not v}
+        if to_apply:
+            session_state.update(to_apply)
 
 
 # Create a global state manager instance